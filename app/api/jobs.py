@@ -2,10 +2,13 @@
 Jobs API endpoints
 """
 
+import asyncio
 import logging
+import os
 from typing import Dict, Any, Optional
 from uuid import UUID
 
+import aiofiles.os
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -298,8 +301,7 @@ async def download_processed_video(
         temp_file_path = video_path
     else:
         # Check if local file exists
-        import os
-        if not os.path.exists(job.final_video_path):
+        if not await asyncio.to_thread(os.path.exists, job.final_video_path):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Processed video file no longer exists on server. The file may have been cleaned up."
@@ -322,10 +324,8 @@ async def download_processed_video(
         
         # Clean up temp file after response is sent if we downloaded from S3
         if temp_file_path:
-            import os
             try:
                 # Schedule cleanup after response is sent
-                import asyncio
                 asyncio.create_task(_cleanup_temp_file_later(temp_file_path))
             except Exception as e:
                 print(f"Warning: Failed to schedule cleanup for temp file {temp_file_path}: {e}")
@@ -335,10 +335,10 @@ async def download_processed_video(
     except Exception as e:
         # Clean up temp file on error
         if temp_file_path:
-            import os
             try:
-                if os.path.exists(temp_file_path):
-                    os.remove(temp_file_path)
+                await aiofiles.os.remove(temp_file_path)
+            except FileNotFoundError:
+                pass
             except Exception as cleanup_error:
                 print(f"Warning: Failed to cleanup temp file {temp_file_path}: {cleanup_error}")
         
@@ -350,15 +350,13 @@ async def download_processed_video(
 
 async def _cleanup_temp_file_later(file_path: str):
     """Clean up temp file after a delay."""
-    import asyncio
-    import os
-    
     # Wait a bit to ensure the file is no longer being used
     await asyncio.sleep(5)
     
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        await aiofiles.os.remove(file_path)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Warning: Failed to cleanup temp file {file_path}: {e}")
 
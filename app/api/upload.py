@@ -2,51 +2,83 @@
 Upload API endpoints with S3 storage support
 """
 
+import zlib
 from typing import Dict, Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, Query
-from fastapi.responses import RedirectResponse
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user, verify_file_upload
+from app.core.dependencies import get_current_user, get_file_service, verify_file_upload, verify_upload_type
+from app.core.http_cache import etag_matches
 from app.database import get_db
 from app.models.user import User
 from app.schemas.upload import (
     UploadResponse, 
     TranscriptUpload, 
+    TranscriptBatchUpload,
     AITranscriptRequest, 
     AITranscriptResponse, 
     AITranscriptValidation, 
-    AITranscriptServiceInfo
+    AITranscriptServiceInfo,
+    PresignedUploadRequest,
+    PresignedUploadResponse,
+    PresignedUploadComplete,
+    S3ConfigCheckResponse,
+    TempCleanupResponse,
+    UploadStatsResponse
 )
 from app.schemas.video import VideoCreate
-from app.services.file_service import FileService
+from app.services.file_service import FileService, PRESIGNED_URL_REFRESH_MARGIN
 from app.repositories.video_repository import VideoRepository
 from app.config import get_settings
 
 router = APIRouter()
 settings = get_settings()
 
+# Chunk size used when streaming S3 objects back to the client
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-@router.get("/config/check")
+# Short-lived cache for the /config/check report
+_config_check_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+
+@router.get("/config/check", response_model=S3ConfigCheckResponse)
 async def check_s3_config(
+    force: bool = Query(False, description="Bypass the cached result and re-test S3"),
     current_user: User = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> S3ConfigCheckResponse:
     """
     Check S3 configuration status.
     
+    The result is cached for a short time since credentials and bucket
+    settings do not change while the process is running.
+    
     Args:
+        force: Whether to bypass the cache
         current_user: Current authenticated user
         
     Returns:
-        Dict with S3 configuration status
+        S3ConfigCheckResponse: S3 configuration status
     """
+    report = None if force else _config_check_cache.get("s3")
+    if report is None:
+        report = _build_s3_config_report()
+        _config_check_cache["s3"] = report
+    
+    return report
+
+
+def _build_s3_config_report() -> S3ConfigCheckResponse:
+    """Build the S3 configuration report, including a connection test."""
     config_status = {
         "aws_access_key_id_configured": bool(settings.aws_access_key_id),
         "aws_secret_access_key_configured": bool(settings.aws_secret_access_key),
         "s3_bucket_name_configured": bool(settings.s3_bucket_name),
         "aws_region": settings.aws_region,
+        "s3_accelerate": settings.s3_accelerate,
         "s3_bucket_name": settings.s3_bucket_name if settings.s3_bucket_name else "Not configured",
         "all_configured": bool(settings.aws_access_key_id and settings.aws_secret_access_key and settings.s3_bucket_name)
     }
@@ -54,8 +86,8 @@ async def check_s3_config(
     if config_status["all_configured"]:
         # Test S3 connection
         try:
-            from app.services.s3_service import S3Service
-            s3_service = S3Service()
+            from app.services.s3_service import get_s3_service
+            s3_service = get_s3_service()
             config_status["s3_connection_status"] = "Success"
             config_status["s3_service_available"] = True
         except Exception as e:
@@ -65,39 +97,49 @@ async def check_s3_config(
         config_status["s3_connection_status"] = "Not tested - missing configuration"
         config_status["s3_service_available"] = False
     
-    return {
-        "status": "success",
-        "s3_configuration": config_status,
-        "recommendations": _get_config_recommendations(config_status)
-    }
+    return S3ConfigCheckResponse(
+        s3_configuration=config_status,
+        recommendations=_get_config_recommendations(config_status)
+    )
+
+
+# Configuration recommendations, keyed by the status bit that triggers them
+_MISSING_ACCESS_KEY = 1 << 0
+_MISSING_SECRET_KEY = 1 << 1
+_MISSING_BUCKET = 1 << 2
+_NOT_CONFIGURED = 1 << 3
+_SERVICE_UNAVAILABLE = 1 << 4
+
+_CONFIG_RECOMMENDATIONS = (
+    (_MISSING_ACCESS_KEY, "Set AWS_ACCESS_KEY_ID in your environment variables"),
+    (_MISSING_SECRET_KEY, "Set AWS_SECRET_ACCESS_KEY in your environment variables"),
+    (_MISSING_BUCKET, "Set S3_BUCKET_NAME in your environment variables"),
+    (_NOT_CONFIGURED, "Ensure your S3 bucket exists and you have proper permissions"),
+    (_NOT_CONFIGURED, "Check your AWS IAM user has s3:GetObject, s3:PutObject, s3:DeleteObject, s3:ListBucket permissions"),
+    (_SERVICE_UNAVAILABLE, "Check your AWS credentials are valid"),
+    (_SERVICE_UNAVAILABLE, "Verify the S3 bucket exists and is accessible"),
+    (_SERVICE_UNAVAILABLE, "Check your AWS region is correct"),
+)
+_CONFIG_OK_RECOMMENDATION = "S3 is properly configured!"
 
 
 def _get_config_recommendations(config_status: Dict[str, Any]) -> List[str]:
     """Get configuration recommendations based on current status."""
-    recommendations = []
-    
-    if not config_status["aws_access_key_id_configured"]:
-        recommendations.append("Set AWS_ACCESS_KEY_ID in your environment variables")
-    
-    if not config_status["aws_secret_access_key_configured"]:
-        recommendations.append("Set AWS_SECRET_ACCESS_KEY in your environment variables")
-    
-    if not config_status["s3_bucket_name_configured"]:
-        recommendations.append("Set S3_BUCKET_NAME in your environment variables")
-    
-    if not config_status["all_configured"]:
-        recommendations.append("Ensure your S3 bucket exists and you have proper permissions")
-        recommendations.append("Check your AWS IAM user has s3:GetObject, s3:PutObject, s3:DeleteObject, s3:ListBucket permissions")
-    
-    if config_status["all_configured"] and not config_status.get("s3_service_available", False):
-        recommendations.append("Check your AWS credentials are valid")
-        recommendations.append("Verify the S3 bucket exists and is accessible")
-        recommendations.append("Check your AWS region is correct")
+    mask = (
+        (not config_status["aws_access_key_id_configured"]) * _MISSING_ACCESS_KEY
+        | (not config_status["aws_secret_access_key_configured"]) * _MISSING_SECRET_KEY
+        | (not config_status["s3_bucket_name_configured"]) * _MISSING_BUCKET
+        | (not config_status["all_configured"]) * _NOT_CONFIGURED
+        | (
+            config_status["all_configured"]
+            and not config_status.get("s3_service_available", False)
+        ) * _SERVICE_UNAVAILABLE
+    )
     
-    if not recommendations:
-        recommendations.append("S3 is properly configured!")
+    if not mask:
+        return [_CONFIG_OK_RECOMMENDATION]
     
-    return recommendations
+    return [message for bit, message in _CONFIG_RECOMMENDATIONS if mask & bit]
 
 
 @router.post("/video", response_model=UploadResponse)
@@ -105,8 +147,15 @@ async def upload_video(
     file: UploadFile = File(...),
     is_temp: bool = Query(True, description="Whether this is a temporary upload"),
     custom_name: str = Query(None, description="Custom name for the video (optional)"),
+    chunk_size: int = Query(
+        None,
+        ge=5 * 1024 * 1024,
+        le=512 * 1024 * 1024,
+        description="Multipart part size in bytes (optional, 5MB-512MB)"
+    ),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    file_service: FileService = Depends(get_file_service)
 ) -> UploadResponse:
     """
     Upload a video file to S3 for YouTube Short creation.
@@ -115,8 +164,10 @@ async def upload_video(
         file: Video file to upload
         is_temp: Whether this is a temporary file (default: True)
         custom_name: Custom name for the video (optional)
+        chunk_size: Multipart part size in bytes (optional)
         current_user: Current authenticated user
         db: Database session
+        file_service: File service
         
     Returns:
         UploadResponse: Upload information including S3 details
@@ -124,6 +175,9 @@ async def upload_video(
     Raises:
         HTTPException: If upload fails
     """
+    # Reject by name/content type before looking at the body
+    verify_upload_type(file.filename, file.content_type, "video")
+    
     # Validate file
     file_info = verify_file_upload(file)
     
@@ -134,14 +188,14 @@ async def upload_video(
         )
     
     # Save file to S3
-    file_service = FileService(db)
     try:
         upload_response = await file_service.save_uploaded_file(
             file=file,
             file_type="video",
             user_id=current_user.id,
             is_temp=is_temp,
-            custom_name=custom_name
+            custom_name=custom_name,
+            chunk_size=chunk_size
         )
         
         # If this is a video and not temporary, also save to videos table for easy reuse
@@ -184,13 +238,72 @@ async def upload_video(
         )
 
 
+@router.post("/video/presign", response_model=PresignedUploadResponse)
+async def presign_video_upload(
+    request: PresignedUploadRequest,
+    current_user: User = Depends(get_current_user),
+    file_service: FileService = Depends(get_file_service)
+) -> PresignedUploadResponse:
+    """
+    Issue a presigned POST so the client can upload a video directly to S3.
+    
+    The client POSTs the file to the returned URL with the returned form
+    fields, then calls /video/complete to record the upload.
+    
+    Args:
+        request: Filename, content type and optional custom name
+        current_user: Current authenticated user
+        file_service: File service
+        
+    Returns:
+        PresignedUploadResponse: Upload ID, POST URL and form fields
+    """
+    verify_upload_type(request.filename, request.content_type, "video")
+    
+    presigned = await file_service.create_presigned_upload(
+        filename=request.filename,
+        content_type=request.content_type,
+        file_type="video",
+        user_id=current_user.id,
+        custom_name=request.custom_name
+    )
+    
+    return PresignedUploadResponse(**presigned)
+
+
+@router.post("/video/complete", response_model=UploadResponse)
+async def complete_video_upload(
+    request: PresignedUploadComplete,
+    current_user: User = Depends(get_current_user),
+    file_service: FileService = Depends(get_file_service)
+) -> UploadResponse:
+    """
+    Record a video that was uploaded directly to S3 via /video/presign.
+    
+    Args:
+        request: Upload ID, filename and optional custom name used when presigning
+        current_user: Current authenticated user
+        file_service: File service
+        
+    Returns:
+        UploadResponse: Upload information
+    """
+    return await file_service.complete_presigned_upload(
+        upload_id=request.upload_id,
+        filename=request.filename,
+        file_type="video",
+        user_id=current_user.id,
+        custom_name=request.custom_name
+    )
+
+
 @router.post("/transcript-text", response_model=UploadResponse)
 async def upload_transcript_text(
     transcript_data: TranscriptUpload,
     is_temp: bool = Query(True, description="Whether this is a temporary upload"),
     custom_name: str = Query(None, description="Custom name for the transcript (optional)"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    file_service: FileService = Depends(get_file_service)
 ) -> UploadResponse:
     """
     Upload transcript as text content to S3.
@@ -200,7 +313,7 @@ async def upload_transcript_text(
         is_temp: Whether this is a temporary file (default: True)
         custom_name: Custom name for the transcript (optional)
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
         UploadResponse: Upload information including S3 details
@@ -215,7 +328,6 @@ async def upload_transcript_text(
         )
     
     # Save transcript to S3
-    file_service = FileService(db)
     try:
         upload_response = await file_service.save_transcript_text(
             content=transcript_data.content,
@@ -231,13 +343,49 @@ async def upload_transcript_text(
         )
 
 
+@router.post("/transcript-text/batch", response_model=List[UploadResponse])
+async def upload_transcript_text_batch(
+    batch: TranscriptBatchUpload,
+    is_temp: bool = Query(True, description="Whether these are temporary uploads"),
+    current_user: User = Depends(get_current_user),
+    file_service: FileService = Depends(get_file_service)
+) -> List[UploadResponse]:
+    """
+    Upload several transcripts as text content to S3 in one request.
+    
+    Args:
+        batch: Transcripts to upload (up to 100)
+        is_temp: Whether these are temporary files (default: True)
+        current_user: Current authenticated user
+        file_service: File service
+        
+    Returns:
+        List[UploadResponse]: Upload information, in request order
+        
+    Raises:
+        HTTPException: If any transcript is empty or an upload fails
+    """
+    contents = [transcript.content for transcript in batch.transcripts]
+    if any(not content.strip() for content in contents):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Transcript content cannot be empty"
+        )
+    
+    return await file_service.save_transcript_texts(
+        contents=contents,
+        user_id=current_user.id,
+        is_temp=is_temp
+    )
+
+
 @router.post("/transcript-file", response_model=UploadResponse)
 async def upload_transcript_file(
     file: UploadFile = File(...),
     is_temp: bool = Query(True, description="Whether this is a temporary upload"),
     custom_name: str = Query(None, description="Custom name for the transcript (optional)"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    file_service: FileService = Depends(get_file_service)
 ) -> UploadResponse:
     """
     Upload transcript file to S3.
@@ -247,7 +395,7 @@ async def upload_transcript_file(
         is_temp: Whether this is a temporary file (default: True)
         custom_name: Custom name for the transcript (optional)
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
         UploadResponse: Upload information including S3 details
@@ -255,6 +403,9 @@ async def upload_transcript_file(
     Raises:
         HTTPException: If upload fails
     """
+    # Reject by name before looking at the body
+    verify_upload_type(file.filename, file.content_type, "transcript")
+    
     # Validate file
     file_info = verify_file_upload(file)
     
@@ -265,7 +416,6 @@ async def upload_transcript_file(
         )
     
     # Save file to S3
-    file_service = FileService(db)
     try:
         upload_response = await file_service.save_uploaded_file(
             file=file,
@@ -285,16 +435,21 @@ async def upload_transcript_file(
 @router.get("/{upload_id}", response_model=UploadResponse)
 async def get_upload(
     upload_id: UUID,
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    file_service: FileService = Depends(get_file_service)
 ) -> UploadResponse:
     """
     Get upload information by ID.
     
+    Responses carry an ETag; a matching If-None-Match gets an empty
+    304 Not Modified instead of the serialized upload.
+    
     Args:
         upload_id: Upload UUID
+        request: Incoming request (for If-None-Match)
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
         UploadResponse: Upload information
@@ -302,8 +457,7 @@ async def get_upload(
     Raises:
         HTTPException: If upload not found
     """
-    file_service = FileService(db)
-    upload = await file_service.get_upload_by_id(upload_id)
+    upload = await file_service.get_upload_response(upload_id)
     
     if not upload:
         raise HTTPException(
@@ -311,14 +465,19 @@ async def get_upload(
             detail="Upload not found"
         )
     
-    return UploadResponse(
-        id=upload.id,
-        filename=upload.filename,
-        original_filename=upload.original_filename,
-        file_type=upload.file_type,
-        file_size_mb=upload.file_size_mb,
-        upload_time=upload.upload_time
-    )
+    etag = _upload_etag(upload)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return ORJSONResponse(content=upload.model_dump(mode="json", by_alias=True), headers=headers)
+
+
+def _upload_etag(upload: UploadResponse) -> str:
+    """Build an ETag from the fields of an upload that can change."""
+    filename_hash = zlib.crc32(upload.filename.encode("utf-8"))
+    return f'"{upload.id}-{int(upload.upload_time.timestamp())}-{filename_hash:08x}"'
 
 
 @router.get("/{upload_id}/download")
@@ -326,7 +485,7 @@ async def download_upload(
     upload_id: UUID,
     use_presigned: bool = Query(True, description="Use presigned URL for download"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    file_service: FileService = Depends(get_file_service)
 ):
     """
     Download an uploaded file from S3.
@@ -335,7 +494,7 @@ async def download_upload(
         upload_id: Upload UUID
         use_presigned: Whether to use presigned URL (default: True)
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
         Redirect to presigned URL or file content
@@ -343,58 +502,65 @@ async def download_upload(
     Raises:
         HTTPException: If upload not found
     """
-    file_service = FileService(db)
-    upload = await file_service.get_upload_by_id(upload_id)
-    
-    if not upload:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Upload not found"
-        )
-    
     if use_presigned:
-        # Generate presigned URL and redirect
+        # Generate (or reuse a cached) presigned URL and redirect
         try:
             presigned_url = await file_service.get_presigned_download_url(upload_id)
-            return RedirectResponse(url=presigned_url, status_code=302)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to generate download URL: {str(e)}"
             )
-    else:
-        # Direct download (not recommended for large files)
-        try:
-            from fastapi.responses import Response
-            
-            file_content = await file_service.get_file_content(upload_id)
-            
-            # Determine content type
-            content_type = "application/octet-stream"
-            if upload.file_type == "video":
-                content_type = "video/mp4"
-            elif upload.file_type == "transcript":
-                content_type = "text/plain"
-            
-            return Response(
-                content=file_content,
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f"attachment; filename={upload.original_filename}"
-                }
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to download file: {str(e)}"
-            )
+        
+        return RedirectResponse(
+            url=presigned_url,
+            status_code=302,
+            headers={"Cache-Control": f"private, max-age={PRESIGNED_URL_REFRESH_MARGIN}"}
+        )
+    
+    upload = await file_service.get_upload_by_id(upload_id)
+    
+    if not upload:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    
+    # Direct download, streamed from S3 in 1MB chunks read off the S3 thread pool
+    try:
+        body = await file_service.get_file_stream(upload)
+        
+        # Determine content type
+        content_type = "application/octet-stream"
+        if upload.file_type == "video":
+            content_type = "video/mp4"
+        elif upload.file_type == "transcript":
+            content_type = "text/plain"
+        
+        return StreamingResponse(
+            file_service.s3_service.iter_file_chunks(body, chunk_size=DOWNLOAD_CHUNK_SIZE),
+            media_type=content_type,
+            headers={
+                "Content-Disposition": f"attachment; filename={upload.original_filename}",
+                "Content-Length": str(upload.file_size_bytes)
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to download file: {str(e)}"
+        )
 
 
 @router.post("/{upload_id}/move-to-permanent")
 async def move_to_permanent(
     upload_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    file_service: FileService = Depends(get_file_service)
 ) -> Dict[str, str]:
     """
     Move a temporary upload to permanent storage.
@@ -402,7 +568,7 @@ async def move_to_permanent(
     Args:
         upload_id: Upload UUID
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
         Dict with success message
@@ -410,7 +576,6 @@ async def move_to_permanent(
     Raises:
         HTTPException: If upload not found or move fails
     """
-    file_service = FileService(db)
     success = await file_service.move_temp_to_permanent(upload_id)
     
     if not success:
@@ -426,7 +591,7 @@ async def move_to_permanent(
 async def delete_upload(
     upload_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    file_service: FileService = Depends(get_file_service)
 ) -> Dict[str, str]:
     """
     Delete an upload and its associated S3 file.
@@ -434,7 +599,7 @@ async def delete_upload(
     Args:
         upload_id: Upload UUID
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
         Dict with success message
@@ -442,7 +607,6 @@ async def delete_upload(
     Raises:
         HTTPException: If upload not found or deletion fails
     """
-    file_service = FileService(db)
     success = await file_service.delete_upload(upload_id)
     
     if not success:
@@ -454,55 +618,52 @@ async def delete_upload(
     return {"status": "success", "message": "Upload deleted successfully"}
 
 
-@router.post("/cleanup-temp")
+@router.post("/cleanup-temp", response_model=TempCleanupResponse, response_model_exclude_unset=True)
 async def cleanup_temp_files(
     hours: int = Query(24, ge=1, le=168, description="Files older than this many hours will be deleted"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-) -> Dict[str, Any]:
+    file_service: FileService = Depends(get_file_service)
+) -> TempCleanupResponse:
     """
     Clean up temporary files older than specified hours.
     
     Args:
         hours: Files older than this many hours will be deleted (1-168 hours)
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
-        Dict with cleanup statistics
+        TempCleanupResponse: Cleanup statistics
     """
-    file_service = FileService(db)
     result = await file_service.cleanup_temp_files(hours)
     
-    return {
-        "status": "success",
-        "message": f"Cleanup completed for files older than {hours} hours",
-        "cleanup_result": result
-    }
+    # Only the keys the cleanup reported are set, so unset optional keys are
+    # left out of the response rather than sent as null
+    return TempCleanupResponse(
+        status="success",
+        message=f"Cleanup completed for files older than {hours} hours",
+        cleanup_result=result
+    )
 
 
-@router.get("/stats/overview")
+@router.get("/stats/overview", response_model=UploadStatsResponse, response_model_exclude_unset=True)
 async def get_upload_stats(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-) -> Dict[str, Any]:
+    file_service: FileService = Depends(get_file_service)
+) -> UploadStatsResponse:
     """
     Get upload statistics and overview.
     
     Args:
         current_user: Current authenticated user
-        db: Database session
+        file_service: File service
         
     Returns:
-        Dict with upload statistics
+        UploadStatsResponse: Upload statistics
     """
-    file_service = FileService(db)
     stats = await file_service.get_upload_stats()
     
-    return {
-        "status": "success",
-        "statistics": stats
-    }
+    return UploadStatsResponse(status="success", statistics=stats)
 
 
 @router.get("/debug/s3-test/{s3_key:path}")
@@ -522,10 +683,10 @@ async def debug_s3_access(
     Returns:
         Dict with debug information
     """
-    from app.services.s3_service import S3Service
+    from app.services.s3_service import get_s3_service
     
     try:
-        s3_service = S3Service()
+        s3_service = get_s3_service()
         
         # Test 1: Check if file exists
         try:
@@ -600,11 +761,9 @@ async def debug_aws_permissions(
     Returns:
         Dict with permissions test results
     """
-    from app.services.s3_service import S3Service
+    from app.services.s3_service import get_s3_service
     import boto3
-    from app.config import get_settings
     
-    settings = get_settings()
     results = {
         "bucket": settings.s3_bucket_name,
         "region": settings.aws_region,
@@ -614,7 +773,7 @@ async def debug_aws_permissions(
     try:
         # Test 1: List bucket objects (s3:ListBucket)
         try:
-            s3_service = S3Service()
+            s3_service = get_s3_service()
             s3_client = boto3.client(
                 's3',
                 aws_access_key_id=settings.aws_access_key_id,
@@ -2,17 +2,24 @@
 Video API endpoints for S3 video management
 """
 
+import asyncio
+import hashlib
 import math
 from typing import Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_youtube_video_service
+from app.core.http_cache import etag_matches
 from app.database import get_db
 from app.models.user import User
 from app.repositories.video_repository import VideoRepository
+from app.services.s3_service import S3Service, get_s3_service
+from app.services.youtube_video_service import YouTubeVideoService
 from app.schemas.video import (
     VideoListResponse, 
     VideoResponse, 
@@ -24,9 +31,56 @@ from app.schemas.video import (
 
 router = APIRouter()
 
+# Object key suffixes treated as videos when syncing from S3
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+
+# Maximum concurrent S3 HEAD requests during a sync pass
+SYNC_HEAD_CONCURRENCY = 16
+
+# Per-user video stats keyed by user ID. Entries are dropped whenever the
+# user's videos change, so the TTL only bounds staleness from other writers.
+_video_stats_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _video_response_from_row(row) -> VideoResponse:
+    """
+    Build a VideoResponse from a trusted video row without revalidating it.
+    
+    Args:
+        row: Row mapping selected with VIDEO_RESPONSE_COLUMNS
+        
+    Returns:
+        VideoResponse: Unvalidated response model
+    """
+    return VideoResponse.model_construct(
+        **row,
+        file_size_mb=round(row["file_size"] / (1024 * 1024), 2)
+    )
+
+
+async def _video_list_etag(video_repo: VideoRepository, user_id: UUID, request: Request) -> str:
+    """
+    Build a weak ETag for a user's video list request.
+    
+    Combines the list fingerprint with the query string, so each page,
+    search and sort order gets its own tag.
+    
+    Args:
+        video_repo: Video repository
+        user_id: User ID
+        request: Incoming request
+        
+    Returns:
+        str: Weak ETag value
+    """
+    latest_updated_at, count = await video_repo.get_list_version(user_id)
+    fingerprint = f"{user_id}:{latest_updated_at}:{count}:{request.url.query}"
+    return f'W/"{hashlib.md5(fingerprint.encode("utf-8")).hexdigest()}"'
+
 
 @router.get("/s3-videos", response_model=VideoListResponse)
 async def get_s3_videos(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
     search: str = Query(None, description="Search in filename"),
@@ -38,7 +92,11 @@ async def get_s3_videos(
     """
     Get paginated list of user's S3 videos.
     
+    Responses carry a weak ETag; a matching If-None-Match gets an empty
+    304 Not Modified without running the list query.
+    
     Args:
+        request: Incoming request (for If-None-Match)
         page: Page number (1-based)
         page_size: Number of items per page (max 50)
         search: Optional search term for filename
@@ -53,44 +111,44 @@ async def get_s3_videos(
     Raises:
         HTTPException: If error occurs during retrieval
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        # Validate sort_by field
-        valid_sort_fields = ["created_at", "filename", "file_size", "duration"]
-        if sort_by not in valid_sort_fields:
-            sort_by = "created_at"
-        
-        videos, total_count = await video_repo.get_user_videos_paginated(
-            user_id=current_user.id,
-            page=page,
-            page_size=page_size,
-            search=search,
-            sort_by=sort_by,
-            sort_order=sort_order
-        )
-        
-        total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
-        has_more = page < total_pages
-        
-        return VideoListResponse(
-            videos=[VideoResponse.model_validate(video) for video in videos],
-            total_count=total_count,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            has_more=has_more
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching videos: {str(e)}"
-        )
+    video_repo = VideoRepository(db)
+    
+    # Validate sort_by field
+    valid_sort_fields = ["created_at", "filename", "file_size", "duration"]
+    if sort_by not in valid_sort_fields:
+        sort_by = "created_at"
+    
+    etag = await _video_list_etag(video_repo, current_user.id, request)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    videos, total_count = await video_repo.get_user_videos_paginated(
+        user_id=current_user.id,
+        page=page,
+        page_size=page_size,
+        search=search,
+        sort_by=sort_by,
+        sort_order=sort_order
+    )
+    
+    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
+    has_more = page < total_pages
+    
+    # Rows come straight from the database, so skip response validation
+    return ORJSONResponse(content=VideoListResponse.model_construct(
+        videos=[_video_response_from_row(video) for video in videos],
+        total_count=total_count,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more
+    ).model_dump(mode="json", by_alias=True), headers=headers)
 
 
 @router.get("/s3-videos/recent", response_model=RecentVideosResponse)
 async def get_recent_videos(
+    request: Request,
     limit: int = Query(5, ge=1, le=20, description="Number of recent videos"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -98,7 +156,11 @@ async def get_recent_videos(
     """
     Get recent videos for quick selection.
     
+    Responses carry a weak ETag; a matching If-None-Match gets an empty
+    304 Not Modified without running the list query.
+    
     Args:
+        request: Incoming request (for If-None-Match)
         limit: Number of recent videos to return (max 20)
         current_user: Current authenticated user
         db: Database session
@@ -109,23 +171,22 @@ async def get_recent_videos(
     Raises:
         HTTPException: If error occurs during retrieval
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        videos = await video_repo.get_recent_videos(
-            user_id=current_user.id,
-            limit=limit
-        )
-        
-        return RecentVideosResponse(
-            videos=[VideoResponse.model_validate(video) for video in videos]
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching recent videos: {str(e)}"
-        )
+    video_repo = VideoRepository(db)
+    
+    etag = await _video_list_etag(video_repo, current_user.id, request)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    videos = await video_repo.get_recent_videos(
+        user_id=current_user.id,
+        limit=limit
+    )
+    
+    # Rows come straight from the database, so skip response validation
+    return ORJSONResponse(content=RecentVideosResponse.model_construct(
+        videos=[_video_response_from_row(video) for video in videos]
+    ).model_dump(mode="json", by_alias=True), headers=headers)
 
 
 @router.get("/s3-videos/by-key/{s3_key:path}", response_model=VideoResponse)
@@ -148,29 +209,20 @@ async def get_video_by_s3_key(
     Raises:
         HTTPException: If video not found or access denied
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        video = await video_repo.get_by_s3_key(
-            s3_key=s3_key,
-            user_id=current_user.id
-        )
-        
-        if not video:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        return VideoResponse.model_validate(video)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    video_repo = VideoRepository(db)
+    
+    video = await video_repo.get_by_s3_key(
+        s3_key=s3_key,
+        user_id=current_user.id
+    )
+    
+    if not video:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching video: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
         )
+    
+    return VideoResponse.model_validate(video)
 
 
 @router.get("/s3-videos/{video_id}", response_model=VideoResponse)
@@ -193,29 +245,20 @@ async def get_video_by_id(
     Raises:
         HTTPException: If video not found or access denied
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        video = await video_repo.get_by_id(
-            video_id=video_id,
-            user_id=current_user.id
-        )
-        
-        if not video:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        return VideoResponse.model_validate(video)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    video_repo = VideoRepository(db)
+    
+    video = await video_repo.get_by_id(
+        video_id=video_id,
+        user_id=current_user.id
+    )
+    
+    if not video:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching video: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
         )
+    
+    return VideoResponse.model_validate(video)
 
 
 @router.patch("/s3-videos/{video_id}", response_model=VideoResponse)
@@ -240,43 +283,24 @@ async def update_video_metadata(
     Raises:
         HTTPException: If video not found or update fails
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        # Check if video exists and belongs to user
-        existing_video = await video_repo.get_by_id(
-            video_id=video_id,
-            user_id=current_user.id
-        )
-        
-        if not existing_video:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Update video
-        updated_video = await video_repo.update_video(
-            video_id=video_id,
-            user_id=current_user.id,
-            update_data=update_data
-        )
-        
-        if not updated_video:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update video"
-            )
-        
-        return VideoResponse.model_validate(updated_video)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    video_repo = VideoRepository(db)
+    
+    # Update video; no row means it does not exist or is not the user's
+    updated_video = await video_repo.update_video(
+        video_id=video_id,
+        user_id=current_user.id,
+        update_data=update_data
+    )
+    
+    if not updated_video:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating video: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
         )
+    
+    _video_stats_cache.pop(current_user.id, None)
+    
+    return VideoResponse.model_validate(updated_video)
 
 
 @router.delete("/s3-videos/{video_id}")
@@ -299,42 +323,23 @@ async def delete_video(
     Raises:
         HTTPException: If video not found or deletion fails
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        # Check if video exists and belongs to user
-        existing_video = await video_repo.get_by_id(
-            video_id=video_id,
-            user_id=current_user.id
-        )
-        
-        if not existing_video:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Soft delete video
-        success = await video_repo.soft_delete_video(
-            video_id=video_id,
-            user_id=current_user.id
-        )
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete video"
-            )
-        
-        return {"message": "Video deleted successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    video_repo = VideoRepository(db)
+    
+    # Soft delete video; no row means it does not exist or is not the user's
+    success = await video_repo.soft_delete_video(
+        video_id=video_id,
+        user_id=current_user.id
+    )
+    
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error deleting video: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
         )
+    
+    _video_stats_cache.pop(current_user.id, None)
+    
+    return {"message": "Video deleted successfully"}
 
 
 @router.get("/s3-videos/stats/overview", response_model=VideoStats)
@@ -355,35 +360,36 @@ async def get_video_stats(
     Raises:
         HTTPException: If error occurs during retrieval
     """
-    try:
-        video_repo = VideoRepository(db)
-        
-        stats = await video_repo.get_video_stats(current_user.id)
-        
-        return VideoStats(**stats)
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching video stats: {str(e)}"
-        )
+    cached_stats = _video_stats_cache.get(current_user.id)
+    if cached_stats is not None:
+        return cached_stats
+    
+    video_repo = VideoRepository(db)
+    
+    stats = await video_repo.get_video_stats(current_user.id)
+    
+    video_stats = VideoStats(**stats)
+    _video_stats_cache[current_user.id] = video_stats
+    return video_stats
 
 
 @router.post("/s3-videos/sync")
 async def sync_s3_videos(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    s3_service: S3Service = Depends(get_s3_service)
 ) -> Dict[str, Any]:
     """
     Sync S3 video files with the database.
     
-    This endpoint scans the S3 bucket for video files and creates
-    database records for any videos that exist in S3 but aren't
-    tracked in the videos table.
+    This endpoint scans the user's folder in the S3 bucket for video
+    files and creates database records for any videos that exist in S3
+    but aren't tracked in the videos table.
     
     Args:
         current_user: Current authenticated user
         db: Database session
+        s3_service: Shared S3 service
         
     Returns:
         Sync results with counts of processed files
@@ -391,94 +397,99 @@ async def sync_s3_videos(
     Raises:
         HTTPException: If sync fails
     """
-    try:
-        from app.services.s3_service import S3Service
-        
-        s3_service = S3Service()
-        video_repo = VideoRepository(db)
-        
-        sync_results = {
-            "total_s3_files": 0,
-            "video_files_found": 0,
-            "already_tracked": 0,
-            "newly_created": 0,
-            "errors": 0,
-            "created_videos": []
-        }
+    video_repo = VideoRepository(db)
+    
+    sync_results = {
+        "total_s3_files": 0,
+        "video_files_found": 0,
+        "already_tracked": 0,
+        "newly_created": 0,
+        "errors": 0,
+        "created_videos": []
+    }
+    
+    semaphore = asyncio.Semaphore(SYNC_HEAD_CONCURRENCY)
+    
+    async def _build_video(s3_key: str) -> VideoCreate:
+        # Get additional metadata from S3
+        async with semaphore:
+            file_metadata = await s3_service.get_file_metadata(s3_key) or {}
         
-        # List all objects in S3 bucket
-        try:
-            s3_objects = await s3_service.list_objects()
-            sync_results["total_s3_files"] = len(s3_objects)
-            
-            for s3_object in s3_objects:
-                s3_key = s3_object.get("Key", "")
-                
-                # Check if it's a video file (by extension)
-                video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
-                if not any(s3_key.lower().endswith(ext) for ext in video_extensions):
-                    continue
-                
-                sync_results["video_files_found"] += 1
-                
-                # Check if this video is already tracked in the database
-                existing_video = await video_repo.check_s3_key_exists(s3_key, current_user.id)
-                if existing_video:
-                    sync_results["already_tracked"] += 1
-                    continue
-                
-                try:
-                    # Get additional metadata from S3
-                    file_metadata = s3_service.get_object_metadata(s3_key)
-                    
-                    # Extract filename from S3 key
-                    filename = s3_key.split('/')[-1] if '/' in s3_key else s3_key
-                    
-                    # Generate S3 URL
-                    s3_url = s3_service.generate_presigned_url_sync(s3_key, expiration=3600)
-                    
-                    # Create video record
-                    video_data = VideoCreate(
-                        filename=filename,
-                        original_filename=filename,
-                        s3_key=s3_key,
-                        s3_url=s3_url,
-                        s3_bucket=s3_service.bucket_name,
-                        content_type=file_metadata.get("ContentType", "video/mp4"),
-                        file_size=file_metadata.get("ContentLength", 0),
-                        user_id=current_user.id
-                    )
-                    
-                    created_video = await video_repo.create_video(video_data)
-                    sync_results["newly_created"] += 1
-                    sync_results["created_videos"].append({
-                        "id": str(created_video.id),
-                        "filename": created_video.filename,
-                        "s3_key": created_video.s3_key
-                    })
-                    
-                except Exception as video_error:
-                    sync_results["errors"] += 1
-                    print(f"Error creating video record for {s3_key}: {str(video_error)}")
-                    
-        except Exception as s3_error:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error accessing S3: {str(s3_error)}"
-            )
+        # Extract filename from S3 key
+        filename = s3_key.split('/')[-1] if '/' in s3_key else s3_key
         
-        return {
-            "message": "S3 sync completed",
-            "results": sync_results
-        }
+        # Generate S3 URL (signed locally, no network call)
+        s3_url = s3_service.generate_presigned_url_sync(s3_key, expiration=3600)
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error during S3 sync: {str(e)}"
+        return VideoCreate(
+            filename=filename,
+            original_filename=filename,
+            s3_key=s3_key,
+            s3_url=s3_url,
+            s3_bucket=s3_service.bucket_name,
+            content_type=file_metadata.get("content_type") or "video/mp4",
+            file_size=file_metadata.get("content_length", 0),
+            user_id=current_user.id
+        )
+    
+    # Walk the user's folder one S3 page at a time so memory stays bounded
+    async for s3_objects in s3_service.iter_object_pages(prefix=f"{current_user.id}/"):
+        sync_results["total_s3_files"] += len(s3_objects)
+        
+        # Keep only video files (by extension)
+        video_keys = [
+            s3_object["Key"]
+            for s3_object in s3_objects
+            if s3_object["Key"].lower().endswith(VIDEO_EXTENSIONS)
+        ]
+        if not video_keys:
+            continue
+        sync_results["video_files_found"] += len(video_keys)
+        
+        # Resolve which videos are already tracked with a single query
+        tracked_keys = await video_repo.get_existing_s3_keys(current_user.id, video_keys)
+        
+        new_keys = []
+        for s3_key in video_keys:
+            if s3_key in tracked_keys:
+                sync_results["already_tracked"] += 1
+            else:
+                new_keys.append(s3_key)
+        
+        # Fetch metadata for all new objects concurrently
+        outcomes = await asyncio.gather(
+            *(_build_video(s3_key) for s3_key in new_keys),
+            return_exceptions=True
+        )
+        
+        to_create = []
+        for s3_key, outcome in zip(new_keys, outcomes):
+            if isinstance(outcome, Exception):
+                sync_results["errors"] += 1
+                print(f"Error creating video record for {s3_key}: {str(outcome)}")
+            else:
+                to_create.append(outcome)
+        
+        # Insert the page's new video records in one statement
+        created_videos = await video_repo.bulk_create_videos(to_create)
+        sync_results["newly_created"] += len(created_videos)
+        sync_results["errors"] += len(to_create) - len(created_videos)
+        sync_results["created_videos"].extend(
+            {
+                "id": created_video["id"],
+                "filename": created_video["filename"],
+                "s3_key": created_video["s3_key"]
+            }
+            for created_video in created_videos
         )
+    
+    if sync_results["newly_created"]:
+        _video_stats_cache.pop(current_user.id, None)
+    
+    return {
+        "message": "S3 sync completed",
+        "results": sync_results
+    }
 
 
 @router.post("/s3-videos/{video_id}/create-upload-record")
@@ -504,67 +515,49 @@ async def create_upload_record_for_video(
     Raises:
         HTTPException: If video not found or upload record creation fails
     """
-    try:
-        from app.models.upload import Upload
-        from app.schemas.upload import UploadResponse
-        from uuid import uuid4
-        
-        video_repo = VideoRepository(db)
-        
-        # Get the video
-        video = await video_repo.get_by_id(video_id, current_user.id)
-        if not video:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Check if upload record already exists for this video
-        from sqlalchemy import select
-        existing_upload_result = await db.execute(
-            select(Upload).where(Upload.s3_key == video.s3_key)
-        )
-        existing_upload = existing_upload_result.scalar_one_or_none()
-        
-        if existing_upload:
-            return {
-                "message": "Upload record already exists",
-                "upload_id": str(existing_upload.id),
-                "video_id": str(video_id)
-            }
-        
-        # Create upload record for the video
-        upload = Upload(
-            id=uuid4(),
-            filename=video.filename,
-            original_filename=video.original_filename,
-            file_type="video",
-            file_size_bytes=video.file_size,
-            s3_key=video.s3_key,
-            s3_url=video.s3_url,
-            s3_bucket=video.s3_bucket,
-            is_temp=False,
-            is_active=True
+    from app.models.upload import Upload
+    from uuid import uuid4
+    
+    video_repo = VideoRepository(db)
+    
+    # Get the video and any existing upload record in one query
+    video, existing_upload = await video_repo.get_with_upload(video_id, current_user.id)
+    if not video:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
         )
-        
-        db.add(upload)
-        await db.commit()
-        await db.refresh(upload)
-        
+    
+    if existing_upload:
         return {
-            "message": "Upload record created successfully",
-            "upload_id": str(upload.id),
-            "video_id": str(video_id),
-            "s3_key": video.s3_key
+            "message": "Upload record already exists",
+            "upload_id": str(existing_upload.id),
+            "video_id": str(video_id)
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating upload record: {str(e)}"
-        )
+    
+    # Create upload record for the video
+    upload = Upload(
+        id=uuid4(),
+        filename=video.filename,
+        original_filename=video.original_filename,
+        file_type="video",
+        file_size_bytes=video.file_size,
+        s3_key=video.s3_key,
+        s3_url=video.s3_url,
+        s3_bucket=video.s3_bucket,
+        is_temp=False,
+        is_active=True
+    )
+    
+    db.add(upload)
+    await db.commit()
+    
+    return {
+        "message": "Upload record created successfully",
+        "upload_id": str(upload.id),
+        "video_id": str(video_id),
+        "s3_key": video.s3_key
+    }
 
 
 @router.get("/youtube-videos", response_model=Dict[str, Any])
@@ -573,7 +566,7 @@ async def get_youtube_videos(
     page_size: int = Query(20, ge=1, le=50, description="Items per page"),
     next_page_token: str = Query(None, description="YouTube API next page token"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    youtube_service: YouTubeVideoService = Depends(get_youtube_video_service)
 ) -> Dict[str, Any]:
     """
     Get paginated list of user's YouTube videos with S3 sync status.
@@ -583,7 +576,7 @@ async def get_youtube_videos(
         page_size: Number of items per page (max 50)
         next_page_token: YouTube API pagination token
         current_user: Current authenticated user
-        db: Database session
+        youtube_service: YouTube video service
         
     Returns:
         Paginated list of YouTube videos with S3 status
@@ -591,39 +584,28 @@ async def get_youtube_videos(
     Raises:
         HTTPException: If error occurs during retrieval
     """
-    try:
-        from app.services.youtube_video_service import YouTubeVideoService
-        
-        youtube_service = YouTubeVideoService(db)
-        
-        # Get YouTube videos from user's channel
-        videos_response = await youtube_service.get_user_youtube_videos(
-            user_id=current_user.id,
-            page_size=page_size,
-            page_token=next_page_token
-        )
-        
-        return {
-            "videos": videos_response["videos"],
-            "total_count": videos_response.get("total_count", len(videos_response["videos"])),
-            "page": page,
-            "page_size": page_size,
-            "has_more": videos_response.get("has_more", False),
-            "next_page_token": videos_response.get("next_page_token"),
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching YouTube videos: {str(e)}"
-        )
+    # Get YouTube videos from user's channel
+    videos_response = await youtube_service.get_user_youtube_videos(
+        user_id=current_user.id,
+        page_size=page_size,
+        page_token=next_page_token
+    )
+    
+    return {
+        "videos": videos_response["videos"],
+        "total_count": videos_response.get("total_count", len(videos_response["videos"])),
+        "page": page,
+        "page_size": page_size,
+        "has_more": videos_response.get("has_more", False),
+        "next_page_token": videos_response.get("next_page_token"),
+    }
 
 
 @router.post("/youtube-videos/{video_id}/add-to-s3")
 async def add_youtube_video_to_s3(
     video_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    youtube_service: YouTubeVideoService = Depends(get_youtube_video_service)
 ) -> Dict[str, Any]:
     """
     Download a YouTube video and add it to S3 storage.
@@ -631,7 +613,7 @@ async def add_youtube_video_to_s3(
     Args:
         video_id: YouTube video ID
         current_user: Current authenticated user
-        db: Database session
+        youtube_service: YouTube video service
         
     Returns:
         Information about the S3 upload
@@ -640,10 +622,6 @@ async def add_youtube_video_to_s3(
         HTTPException: If download or upload fails
     """
     try:
-        from app.services.youtube_video_service import YouTubeVideoService
-        
-        youtube_service = YouTubeVideoService(db)
-        
         # Download video from YouTube and upload to S3
         result = await youtube_service.download_and_upload_to_s3(
             youtube_video_id=video_id,
@@ -669,70 +647,83 @@ async def add_youtube_video_to_s3(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error adding YouTube video to S3: {str(e)}"
-        )
 
 
 @router.post("/youtube-videos/sync-all-to-s3")
 async def sync_all_youtube_videos_to_s3(
+    background_tasks: BackgroundTasks,
     max_videos: int = Query(50, ge=1, le=100, description="Maximum number of videos to sync"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    youtube_service: YouTubeVideoService = Depends(get_youtube_video_service)
 ) -> Dict[str, Any]:
     """
     Sync all YouTube videos to S3 storage (batch operation).
     
+    The sync runs in the background; poll /sync-status/{sync_id} for
+    progress and the final summary.
+    
     Args:
+        background_tasks: FastAPI background tasks
         max_videos: Maximum number of videos to sync in this batch
         current_user: Current authenticated user
-        db: Database session
+        youtube_service: YouTube video service
         
     Returns:
-        Summary of sync operation
+        Sync ID and status URL of the started operation
         
     Raises:
-        HTTPException: If sync operation fails
+        HTTPException: If the sync operation cannot be started
     """
-    try:
-        from app.services.youtube_video_service import YouTubeVideoService
-        
+    sync_status = await youtube_service.start_sync(current_user.id)
+    sync_id = sync_status["sync_id"]
+    
+    # Start background sync operation
+    background_tasks.add_task(
+        sync_youtube_videos_background,
+        sync_id,
+        current_user.id,
+        max_videos
+    )
+    
+    return {
+        "success": True,
+        "message": "Sync operation started",
+        "sync_id": sync_id,
+        "status": sync_status["status"],
+        "status_url": f"/api/v1/videos/sync-status/{sync_id}"
+    }
+
+
+async def sync_youtube_videos_background(sync_id: str, user_id: UUID, max_videos: int):
+    """
+    Background task to sync a user's YouTube videos to S3.
+    
+    Args:
+        sync_id: Sync operation ID registered by start_sync
+        user_id: User UUID
+        max_videos: Maximum number of videos to sync
+    """
+    from app.database import AsyncSessionLocal
+    
+    async with AsyncSessionLocal() as db:
         youtube_service = YouTubeVideoService(db)
         
-        # Start background sync operation
-        result = await youtube_service.sync_all_videos_to_s3(
-            user_id=current_user.id,
-            max_videos=max_videos
-        )
-        
-        return {
-            "success": True,
-            "message": "Sync operation completed",
-            "sync_id": result["sync_id"],
-            "summary": {
-                "total_videos_found": result["total_videos_found"],
-                "videos_already_in_s3": result["videos_already_in_s3"],
-                "videos_synced": result["videos_synced"],
-                "errors": result["errors"],
-                "processing_time_seconds": result["processing_time_seconds"]
-            },
-            "synced_videos": result["synced_videos"]
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error syncing YouTube videos: {str(e)}"
-        )
+        try:
+            await youtube_service.sync_all_videos_to_s3(
+                user_id=user_id,
+                max_videos=max_videos,
+                sync_id=sync_id
+            )
+        except Exception as e:
+            # Failure is already recorded in the sync status
+            print(f"Background sync {sync_id} failed: {str(e)}")
 
 
 @router.get("/sync-status/{sync_id}")
 async def get_sync_status(
     sync_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    youtube_service: YouTubeVideoService = Depends(get_youtube_video_service)
 ) -> Dict[str, Any]:
     """
     Get the status of a sync operation.
@@ -740,7 +731,7 @@ async def get_sync_status(
     Args:
         sync_id: Sync operation ID
         current_user: Current authenticated user
-        db: Database session
+        youtube_service: YouTube video service
         
     Returns:
         Sync operation status and progress
@@ -748,28 +739,16 @@ async def get_sync_status(
     Raises:
         HTTPException: If sync ID not found
     """
-    try:
-        from app.services.youtube_video_service import YouTubeVideoService
-        
-        youtube_service = YouTubeVideoService(db)
-        
-        status = await youtube_service.get_sync_status(sync_id)
-        
-        if not status:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Sync operation not found"
-            )
-            
-        return status
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    sync_status = await youtube_service.get_sync_status(sync_id)
+    
+    # Other users' syncs are reported as missing
+    if not sync_status or sync_status.get("user_id") != str(current_user.id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error getting sync status: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sync operation not found"
         )
+        
+    return sync_status
 
 
 @router.get("/user-s3-videos", response_model=Dict[str, Any])
@@ -777,7 +756,7 @@ async def get_user_s3_videos(
     job_id: UUID = Query(None, description="Filter by specific job ID"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of videos to return"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    s3_service: S3Service = Depends(get_s3_service)
 ) -> Dict[str, Any]:
     """
     Get user's videos from S3 with proper user separation.
@@ -786,7 +765,7 @@ async def get_user_s3_videos(
         job_id: Optional job ID to filter videos by specific job
         limit: Maximum number of videos to return (max 100)
         current_user: Current authenticated user
-        db: Database session
+        s3_service: Shared S3 service
         
     Returns:
         Dict with user's videos and metadata
@@ -794,29 +773,19 @@ async def get_user_s3_videos(
     Raises:
         HTTPException: If error occurs during retrieval
     """
-    try:
-        from app.services.s3_service import S3Service
-        s3_service = S3Service()
-        
-        # Get videos for the current user
-        videos = await s3_service.list_user_videos(
-            user_id=current_user.id,
-            job_id=job_id,
-            limit=limit
-        )
-        
-        return {
-            "status": "success",
-            "user_id": str(current_user.id),
-            "videos": videos,
-            "video_count": len(videos),
-            "filtered_by_job": str(job_id) if job_id else None,
-            "folder_structure": f"{current_user.id}/{job_id}/" if job_id else f"{current_user.id}/",
-            "limit": limit
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching user videos: {str(e)}"
-        ) 
\ No newline at end of file
+    # Get videos for the current user
+    videos = await s3_service.list_user_videos(
+        user_id=current_user.id,
+        job_id=job_id,
+        limit=limit
+    )
+    
+    return {
+        "status": "success",
+        "user_id": str(current_user.id),
+        "videos": videos,
+        "video_count": len(videos),
+        "filtered_by_job": str(job_id) if job_id else None,
+        "folder_structure": f"{current_user.id}/{job_id}/" if job_id else f"{current_user.id}/",
+        "limit": limit
+    }
@@ -2,59 +2,401 @@
 YouTube API endpoints
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
+import inspect
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from functools import lru_cache
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import quote
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response, UploadFile, File, Form, Query, Body
-from fastapi.responses import FileResponse, RedirectResponse
+import orjson
+from cachetools import TTLCache
+
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, UploadFile, File, Query, Body
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.dependencies import get_current_user, get_db
-from app.schemas.upload import SupportedVoices
+from app.core.http_cache import etag_matches
+from app.schemas.upload import SupportedVoices, YouTubeUploadMetadata
 from app.schemas.job import JobCreate, JobResponse
 from app.services.job_service import JobService
-from app.services.youtube_service import YouTubeService
-from app.services.youtube_upload_service import YouTubeUploadService
+from app.services.secret_service import SecretService
+from app.services.youtube_service import YouTubeService, get_youtube_service
+from app.services.youtube_upload_queue import enqueue_upload, get_upload_status, validate_upload
 from app.models.user import User
 from app.services.video_service import VideoService
 # Video schemas removed - not needed for OAuth endpoints
 
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Characters stripped from job titles when building download filenames
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w \-]+")
 
-@router.get("/voices", response_model=SupportedVoices)
-async def get_supported_voices() -> SupportedVoices:
+# Bytes read per chunk when the app streams a local file itself
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Single byte range ("bytes=start-end", either side may be empty); multi-range
+# requests are answered with the whole file
+_BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Bytes copied per chunk when saving an uploaded file to disk. 256KB keeps
+# syscalls few without holding much memory per concurrent upload; sendfile
+# copies stay in the kernel and use 8x this per call.
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Cache-Control for payloads that only change on redeploy
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+# Serialized bodies of static payloads and their ETags, keyed by endpoint
+_static_json_cache: Dict[str, Tuple[bytes, str]] = {}
+
+DEFAULT_PREVIEW_TEXT = "Hello! This is how I sound. Perfect for your YouTube Shorts."
+
+# Resolved TTS preview results keyed by (voice, text digest). Entries expire
+# well within the TTS disk cache's 24h validity, so cached paths stay valid.
+_voice_preview_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+
+# Preview generations in flight, so concurrent requests share one TTS call
+_pending_voice_previews: Dict[Tuple[str, bytes], asyncio.Task] = {}
+
+# Failed preview generations, kept briefly so HEAD can report the failure;
+# the next preview request for the same key starts a fresh attempt
+_failed_voice_previews: TTLCache = TTLCache(maxsize=512, ttl=60)
+
+
+class PathSendFileResponse(FileResponse):
     """
-    Get list of supported TTS voices.
+    FileResponse that lets the server send the file itself when it can.
+    
+    Servers that support the ASGI "http.response.pathsend" extension are
+    handed the file path and can use sendfile(2), so the body never passes
+    through Python. Otherwise the file is read in 1MB chunks instead of
+    Starlette's 64KB.
+    """
+    
+    chunk_size = DOWNLOAD_CHUNK_SIZE
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if self.send_header_only or "http.response.pathsend" not in scope.get("extensions", {}):
+            await super().__call__(scope, receive, send)
+            return
+        
+        if self.stat_result is None:
+            try:
+                stat_result = await asyncio.to_thread(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            self.set_stat_headers(stat_result)
+        
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers
+        })
+        await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+        
+        if self.background is not None:
+            await self.background()
+
+
+def _content_disposition(filename: str) -> str:
+    """Build an attachment Content-Disposition header value for a filename."""
+    quoted_filename = quote(filename)
+    if quoted_filename != filename:
+        return f"attachment; filename*=utf-8''{quoted_filename}"
+    return f'attachment; filename="{filename}"'
+
+
+def _parse_byte_range(range_header: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header against a file size.
+    
+    Args:
+        range_header: Value of the Range request header, if any
+        file_size: Size of the file in bytes
+        
+    Returns:
+        Inclusive (start, end) byte offsets, or None to send the whole file
+        
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    if not range_header:
+        return None
+    
+    match = _BYTE_RANGE.match(range_header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    
+    start_text, end_text = match.groups()
+    if start_text:
+        start = int(start_text)
+        end = min(int(end_text), file_size - 1) if end_text else file_size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(file_size - int(end_text), 0)
+        end = file_size - 1
+    
+    if start > end or start >= file_size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"}
+        )
+    
+    return start, end
+
+
+async def _iter_file_range(path: str, start: int, end: int):
+    """
+    Stream an inclusive byte range of a file, reading off the event loop.
+    
+    Args:
+        path: Local file path
+        start: First byte offset
+        end: Last byte offset
+        
+    Yields:
+        bytes: Chunks of at most DOWNLOAD_CHUNK_SIZE
+    """
+    fd = await asyncio.to_thread(os.open, path, os.O_RDONLY)
+    try:
+        offset = start
+        while offset <= end:
+            chunk = await asyncio.to_thread(os.pread, fd, min(DOWNLOAD_CHUNK_SIZE, end - offset + 1), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+    finally:
+        os.close(fd)
+
+
+def _file_download_response(
+    path: str,
+    filename: str,
+    media_type: str,
+    stat_result: os.stat_result,
+    range_header: Optional[str] = None
+) -> Response:
+    """
+    Build an attachment response for a local file.
+    
+    When X_ACCEL_REDIRECT_PREFIX is configured the transfer is delegated to
+    nginx (which handles Range itself). Otherwise a Range request gets a 206
+    with just that byte range, and a full download is sent by the ASGI
+    server or streamed in large chunks.
+    
+    Args:
+        path: Local file path
+        filename: Download filename for Content-Disposition
+        media_type: Response content type
+        stat_result: os.stat() result for the file
+        range_header: Value of the Range request header, if any
+        
+    Returns:
+        Response: Redirect-to-nginx, partial content or file streaming response
+        
+    Raises:
+        HTTPException: 416 if the requested range cannot be satisfied
+    """
+    content_disposition = _content_disposition(filename)
+    
+    if settings.x_accel_redirect_prefix:
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": settings.x_accel_redirect_prefix.rstrip("/") + quote(os.path.abspath(path)),
+                "Content-Disposition": content_disposition
+            }
+        )
+    
+    byte_range = _parse_byte_range(range_header, stat_result.st_size)
+    if byte_range is None:
+        return PathSendFileResponse(
+            path=path,
+            filename=filename,
+            media_type=media_type,
+            stat_result=stat_result,
+            headers={"Accept-Ranges": "bytes"}
+        )
+    
+    start, end = byte_range
+    return StreamingResponse(
+        _iter_file_range(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{stat_result.st_size}",
+            "Content-Length": str(end - start + 1),
+            "Content-Disposition": content_disposition
+        }
+    )
+
+
+def _stage_upload_file(source: BinaryIO, suffix: str = ".mp4") -> Tuple[str, int]:
+    """
+    Copy an uploaded file to a new temporary file without holding it in memory.
+    
+    Starlette spools uploads over 1MB to a temporary file; those are copied
+    file-to-file with sendfile(2) so the bytes stay in the kernel. Smaller,
+    in-memory uploads are copied in chunks. The temporary file is created
+    and written through a single open handle, with its full size reserved
+    up front so the filesystem can allocate it contiguously.
+    
+    Args:
+        source: The UploadFile's underlying spooled file
+        suffix: Suffix for the temporary file name
+        
+    Returns:
+        Tuple of (temporary file path, number of bytes copied)
+    """
+    source.seek(0, os.SEEK_END)
+    source_size = source.tell()
+    source.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as destination:
+        try:
+            if source_size and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(destination.fileno(), 0, source_size)
+                except OSError:
+                    # Not supported by every filesystem; the copy still works
+                    pass
+            
+            if getattr(source, "_rolled", False) and hasattr(os, "sendfile"):
+                source_fd = source.fileno()
+                destination_fd = destination.fileno()
+                offset = 0
+                while sent := os.sendfile(destination_fd, source_fd, offset, UPLOAD_CHUNK_SIZE * 8):
+                    offset += sent
+                return destination.name, offset
+            
+            shutil.copyfileobj(source, destination, UPLOAD_CHUNK_SIZE)
+            return destination.name, destination.tell()
+        except Exception:
+            os.remove(destination.name)
+            raise
+
+
+async def _static_json_response(request: Request, key: str, build_payload: Callable[[], Any]) -> Response:
+    """
+    Serve a static JSON payload, building and serializing it only once.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        key: Cache key for the payload
+        build_payload: Callable returning the payload (or an awaitable of it)
+        
+    Returns:
+        Response: Pre-serialized JSON, or 304 if the client's copy is current
+    """
+    cached = _static_json_cache.get(key)
+    if cached is None:
+        payload = build_payload()
+        if inspect.isawaitable(payload):
+            payload = await payload
+        body = orjson.dumps(payload)
+        cached = body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _static_json_cache[key] = cached
+    
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=1)
+def _supported_voices_payload() -> SupportedVoices:
+    """
+    Build the supported voices response once per process.
     
     Returns:
         SupportedVoices: List of supported voice names
     """
-    youtube_service = YouTubeService()
-    voices = youtube_service.get_supported_voices()
+    youtube_service = get_youtube_service()
     
     return SupportedVoices(
-        voices=voices,
+        voices=youtube_service.get_supported_voices(),
         default_voice="alloy"
     )
 
 
+@lru_cache(maxsize=1)
+def _voice_details() -> Dict[str, Dict[str, Any]]:
+    """
+    Build the per-voice details mapping once per process.
+    
+    Returns:
+        Dict mapping voice name to its name, description, style and use cases
+    """
+    return get_youtube_service().get_voice_info()["voices"]
+
+
+@lru_cache(maxsize=1)
+def _supported_voice_set() -> FrozenSet[str]:
+    """
+    Build the set of supported voice names once per process.
+    
+    Returns:
+        FrozenSet[str]: Supported voice names, for O(1) membership checks
+    """
+    return frozenset(_voice_details())
+
+
+@router.get("/voices", response_model=SupportedVoices)
+async def get_supported_voices(request: Request) -> Response:
+    """
+    Get list of supported TTS voices.
+    
+    The payload is built from the service's own voice list, so it is
+    returned directly rather than re-validated against the response model.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        
+    Returns:
+        Response: Pre-serialized list of supported voice names
+    """
+    return await _static_json_response(request, "voices", lambda: _supported_voices_payload().model_dump())
+
+
 @router.get("/download/{job_id}")
 async def download_video(
+    request: Request,
     job_id: UUID,
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> FileResponse:
+) -> Response:
     """
     Download the final processed video file.
     
+    Supports single byte-range requests, so players can seek and
+    interrupted downloads can resume.
+    
     Args:
+        request: Incoming request (for the Range header)
         job_id: Job UUID
         current_user: Current authenticated user
         db: Database session
         
     Returns:
-        FileResponse: Video file download
+        Response: Video file download (streamed, or delegated to nginx)
         
     Raises:
         HTTPException: If job not found or video not ready
@@ -80,33 +422,36 @@ async def download_video(
             detail="Final video file not found"
         )
     
-    import os
-    if not os.path.exists(job.final_video_path):
+    try:
+        stat_result = await asyncio.to_thread(os.stat, job.final_video_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Video file no longer exists on server"
         )
     
     # Generate download filename
-    safe_title = "".join(c for c in job.title if c.isalnum() or c in " -_").strip()
+    safe_title = _UNSAFE_TITLE_CHARS.sub("", job.title).strip()
     download_filename = f"{safe_title}_youtube_short.mp4"
     
-    return FileResponse(
+    return _file_download_response(
         path=job.final_video_path,
         filename=download_filename,
-        media_type="video/mp4"
+        media_type="video/mp4",
+        stat_result=stat_result,
+        range_header=request.headers.get("range")
     )
 
 
-@router.get("/info")
-async def get_youtube_info() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def _youtube_info_payload() -> Dict[str, Any]:
     """
-    Get YouTube processing information and capabilities.
+    Build the YouTube service information response once per process.
     
     Returns:
         Dict with YouTube service information
     """
-    youtube_service = YouTubeService()
+    youtube_service = get_youtube_service()
     
     return {
         "service": "YouTube Shorts Creator",
@@ -131,447 +476,545 @@ async def get_youtube_info() -> Dict[str, Any]:
     }
 
 
+@router.get("/info")
+async def get_youtube_info(request: Request) -> Response:
+    """
+    Get YouTube processing information and capabilities.
+    
+    The payload is static, so a matching If-None-Match gets an empty
+    304 Not Modified.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        
+    Returns:
+        Response: Pre-serialized YouTube service information
+    """
+    return await _static_json_response(request, "info", _youtube_info_payload)
+
+
 @router.get("/capabilities")
-async def get_processing_capabilities() -> Dict[str, Any]:
+async def get_processing_capabilities(
+    request: Request,
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> Response:
     """
     Get detailed processing capabilities and system requirements.
     
+    Args:
+        request: Incoming request (for If-None-Match)
+        youtube_service: Shared YouTube service
+        
     Returns:
-        Dict with detailed capabilities information
+        Response: Pre-serialized JSON with detailed capabilities information
     """
-    youtube_service = YouTubeService()
-    capabilities = await youtube_service.get_processing_capabilities()
-    
-    return capabilities
+    return await _static_json_response(request, "capabilities", youtube_service.get_processing_capabilities)
 
 
 @router.get("/requirements")
-async def check_system_requirements() -> Dict[str, Any]:
+async def check_system_requirements(
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> Dict[str, Any]:
     """
     Check system requirements and configuration status.
     
+    Args:
+        youtube_service: Shared YouTube service
+        
     Returns:
         Dict with system requirements status
     """
-    youtube_service = YouTubeService()
     requirements = await youtube_service.validate_processing_requirements()
     
     return requirements
 
 
 @router.get("/setup")
-async def get_setup_instructions() -> Dict[str, Any]:
+async def get_setup_instructions(
+    request: Request,
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> Response:
     """
     Get setup instructions for configuring the YouTube processing system.
     
+    Args:
+        request: Incoming request (for If-None-Match)
+        youtube_service: Shared YouTube service
+        
     Returns:
-        Dict with setup instructions
+        Response: Pre-serialized JSON with setup instructions
     """
-    youtube_service = YouTubeService()
-    instructions = await youtube_service.get_setup_instructions()
-    
-    return instructions
+    return await _static_json_response(request, "setup", youtube_service.get_setup_instructions)
 
 
 @router.get("/voices/detailed")
-async def get_detailed_voice_info() -> Dict[str, Any]:
+async def get_detailed_voice_info(
+    request: Request,
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> Response:
     """
     Get detailed information about available TTS voices.
     
+    Args:
+        request: Incoming request (for If-None-Match)
+        youtube_service: Shared YouTube service
+        
     Returns:
-        Dict with detailed voice information
+        Response: Pre-serialized JSON with detailed voice information
     """
-    youtube_service = YouTubeService()
-    voice_info = youtube_service.get_voice_info()
-    
-    return voice_info
+    return await _static_json_response(request, "voices/detailed", youtube_service.get_voice_info)
 
 
 @router.get("/guidelines")
-async def get_youtube_guidelines() -> Dict[str, Any]:
+async def get_youtube_guidelines(
+    request: Request,
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> Response:
     """
     Get YouTube upload guidelines and optimization tips.
     
+    Args:
+        request: Incoming request (for If-None-Match)
+        youtube_service: Shared YouTube service
+        
     Returns:
-        Dict with YouTube guidelines
+        Response: Pre-serialized JSON with YouTube guidelines
     """
-    youtube_service = YouTubeService()
-    guidelines = await youtube_service.get_youtube_guidelines()
-    
-    return guidelines
+    return await _static_json_response(
+        request, "guidelines", youtube_service.youtube_upload_service.get_upload_guidelines
+    )
 
 
-@router.post("/upload-direct")
+@router.post("/upload-direct", status_code=status.HTTP_202_ACCEPTED)
 async def upload_video_to_youtube_direct(
     file: UploadFile = File(...),
-    title: str = Form(...),
-    description: str = Form(""),
-    tags: str = Form(""),
-    category: str = Form("entertainment"),
-    privacy: str = Form("public"),
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    metadata: YouTubeUploadMetadata = Depends(YouTubeUploadMetadata.as_form),
+    current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
     Upload a video file directly to YouTube without processing.
     
     This endpoint allows you to upload an already-processed video
     directly to YouTube, bypassing the full processing pipeline.
+    The file is saved and queued; poll /upload-status/{upload_id}
+    for the YouTube result.
     
     Args:
         file: Video file to upload
-        title: YouTube video title
-        description: Video description
-        tags: Comma-separated list of tags
-        category: Video category
-        privacy: Privacy setting (public, unlisted, private)
+        metadata: YouTube title, description, tags, category and privacy
         current_user: Current authenticated user
         
     Returns:
-        Dict with YouTube upload results
+        Dict with upload ID and status URL
         
     Raises:
-        HTTPException: If upload fails
+        HTTPException: If the upload queue is full
     """
-    try:
-        # Parse tags
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else []
-        
-        # Save uploaded file temporarily
-        import tempfile
-        import aiofiles
-        
-        temp_file = None
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
-                temp_file_path = temp_file.name
-            
-            # Save uploaded content to temporary file
-            async with aiofiles.open(temp_file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
-            
-            # Initialize YouTube upload service
-            youtube_upload_service = YouTubeUploadService()
-            
-            # Upload to YouTube
-            upload_result = await youtube_upload_service.upload_video_to_youtube(
-                video_path=temp_file_path,
-                title=title,
-                description=description,
-                tags=tag_list,
-                category=category,
-                privacy=privacy
-            )
-            
-            if upload_result["status"] == "error":
-                raise Exception(upload_result["error_message"])
-            
-            # Clean up temporary file
-            import os
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-            
-            return {
-                "success": True,
-                "message": "Video uploaded to YouTube successfully",
-                "youtube_data": upload_result,
-                "upload_info": {
-                    "original_filename": file.filename,
-                    "file_size_mb": len(content) / (1024 * 1024),
-                    "title": title,
-                    "tags": tag_list,
-                    "category": category,
-                    "privacy": privacy
-                }
-            }
-            
-        except Exception as e:
-            # Clean up on error
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-            raise e
-            
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload video to YouTube: {str(e)}"
-        )
+    # Reject bad metadata before copying the file rather than after the
+    # upload has been queued and retried
+    upload_kwargs = metadata.model_dump()
+    await validate_upload(upload_kwargs)
+    
+    # Save uploaded file temporarily; file creation and copy both run off the event loop
+    temp_file_path, file_size = await asyncio.to_thread(_stage_upload_file, file.file)
+    
+    # The queue worker removes the temporary file when it is done
+    upload_status = await enqueue_upload(
+        user_id=current_user.id,
+        video_path=temp_file_path,
+        upload_kwargs=upload_kwargs,
+        cleanup_path=temp_file_path
+    )
+    upload_id = upload_status["upload_id"]
+    
+    return {
+        "success": True,
+        "message": "Video queued for upload to YouTube",
+        "upload_id": upload_id,
+        "status": upload_status["status"],
+        "status_url": f"/api/v1/youtube/upload-status/{upload_id}",
+        "upload_info": {
+            "original_filename": file.filename,
+            "file_size_mb": file_size / (1024 * 1024),
+            "title": metadata.title,
+            "tags": metadata.tags,
+            "category": metadata.category,
+            "privacy": metadata.privacy
+        }
+    }
 
 
-@router.post("/upload-from-job")
+@router.post("/upload-from-job", status_code=status.HTTP_202_ACCEPTED)
 async def upload_processed_video_to_youtube(
     job_id: UUID,
-    title: str = Form(...),
-    description: str = Form(""),
-    tags: str = Form(""),
-    category: str = Form("entertainment"),
-    privacy: str = Form("public"),
-    current_user: Dict[str, Any] = Depends(get_current_user),
+    metadata: YouTubeUploadMetadata = Depends(YouTubeUploadMetadata.as_form),
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
     Upload a processed video from an existing job to YouTube.
     
-    This endpoint takes a completed job and uploads its final video to YouTube
-    with custom metadata.
+    This endpoint takes a completed job and queues its final video for
+    upload to YouTube with custom metadata. The job is updated with the
+    YouTube URL once the upload succeeds; poll /upload-status/{upload_id}
+    for the result.
     
     Args:
         job_id: Job UUID with completed processing
-        title: YouTube video title
-        description: Video description
-        tags: Comma-separated list of tags
-        category: Video category
-        privacy: Privacy setting
+        metadata: YouTube title, description, tags, category and privacy
         current_user: Current authenticated user
         db: Database session
         
     Returns:
-        Dict with YouTube upload results
+        Dict with upload ID and status URL
     """
-    try:
-        # Get job details
-        job_service = JobService(db)
-        job = await job_service.get_job_by_id(job_id)
+    # Get job details
+    job_service = JobService(db)
+    job = await job_service.get_job_by_id(job_id)
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Job must be completed. Current status: {job.status}"
+        )
+    
+    if not job.final_video_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No final video file found for this job"
+        )
+    
+    # Reject bad metadata before downloading the video from S3
+    upload_kwargs = metadata.model_dump()
+    await validate_upload(upload_kwargs)
+    
+    # Handle S3 URLs vs local file paths
+    video_path = job.final_video_path
+    temp_file_path = None
+    
+    if job.final_video_path.startswith("s3://"):
+        # Download from S3 to temp file
+        video_service = VideoService()
         
-        if not job:
+        download_result = await video_service.download_video_from_s3(job.final_video_path)
+        if download_result.get("status") != "success":
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job not found"
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to download video from S3: {download_result.get('error_message')}"
             )
         
-        if job.status != "completed":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Job must be completed. Current status: {job.status}"
-            )
+        video_path = download_result.get("local_path")
+        temp_file_path = video_path
+    # A video recorded on the job within the last hour is trusted to be on
+    # disk; if it was removed anyway, the queued upload fails and reports it
+    elif not job.final_video_recently_written and not await asyncio.to_thread(os.path.exists, job.final_video_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Final video file no longer exists on server"
+        )
+    
+    async def record_youtube_upload(upload_result: Dict[str, Any]) -> None:
+        """Store the YouTube URL on the job; runs after the request has ended."""
+        from app.database import AsyncSessionLocal
         
-        if not job.final_video_path:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No final video file found for this job"
+        async with AsyncSessionLocal() as session:
+            await JobService(session).finalize_youtube_upload(
+                job_id=job_id,
+                youtube_url=upload_result["video_url"],
+                youtube_video_id=upload_result["video_id"],
+                message="Video uploaded to YouTube via direct upload"
             )
+    
+    # The queue worker removes any S3 download when it is done
+    upload_status = await enqueue_upload(
+        user_id=current_user.id,
+        video_path=video_path,
+        upload_kwargs=upload_kwargs,
+        cleanup_path=temp_file_path,
+        on_success=record_youtube_upload
+    )
+    upload_id = upload_status["upload_id"]
+    
+    return {
+        "success": True,
+        "message": "Processed video queued for upload to YouTube",
+        "job_id": str(job_id),
+        "upload_id": upload_id,
+        "status": upload_status["status"],
+        "status_url": f"/api/v1/youtube/upload-status/{upload_id}",
+        "upload_info": {
+            "original_job_title": job.title,
+            "new_title": metadata.title,
+            "tags": metadata.tags,
+            "category": metadata.category,
+            "privacy": metadata.privacy
+        }
+    }
+
+
+@router.get("/upload-status/{upload_id}")
+async def get_youtube_upload_status(
+    upload_id: str,
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Get the status of a queued YouTube upload.
+    
+    Args:
+        upload_id: Upload ID returned by an upload endpoint
+        current_user: Current authenticated user
         
-        # Handle S3 URLs vs local file paths
-        video_path = job.final_video_path
-        temp_file_path = None
-        
-        if job.final_video_path.startswith("s3://"):
-            # Download from S3 to temp file
-            video_service = VideoService()
-            
-            download_result = await video_service.download_video_from_s3(job.final_video_path)
-            if download_result.get("status") != "success":
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to download video from S3: {download_result.get('error_message')}"
-                )
-            
-            video_path = download_result.get("local_path")
-            temp_file_path = video_path
-        else:
-            # Check if local file exists
-            import os
-            if not os.path.exists(job.final_video_path):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Final video file no longer exists on server"
-                )
-        
-        # Parse tags
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else []
-        
-        # Upload to YouTube
-        youtube_upload_service = YouTubeUploadService()
-        upload_result = await youtube_upload_service.upload_video_to_youtube(
-            video_path=video_path,
-            title=title,
-            description=description,
-            tags=tag_list,
-            category=category,
-            privacy=privacy
-        )
-        
-        if upload_result["status"] == "error":
-            raise Exception(upload_result["error_message"])
+    Returns:
+        Upload status, attempts and the YouTube result once completed
         
-        # Clean up temp file if we downloaded from S3
-        if temp_file_path:
-            import os
-            try:
-                if os.path.exists(temp_file_path):
-                    os.remove(temp_file_path)
-            except Exception as e:
-                print(f"Warning: Failed to cleanup temp file {temp_file_path}: {e}")
-        
-        # Update job with YouTube info
-        await job_service.update_job_progress(
-            job_id=job_id,
-            progress=100,
-            message="Video uploaded to YouTube via direct upload",
-            status="completed"
+    Raises:
+        HTTPException: If upload ID not found
+    """
+    upload_status = get_upload_status(upload_id)
+    
+    # Other users' uploads are reported as missing
+    if not upload_status or upload_status.get("user_id") != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
         )
+    
+    return upload_status
+
+
+def _voice_preview_key(voice: str, text: str) -> Tuple[str, bytes]:
+    """Build the cache key for a voice preview."""
+    return voice, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+async def _generate_voice_preview(
+    youtube_service: YouTubeService,
+    cache_key: Tuple[str, bytes],
+    voice: str,
+    text: str
+) -> Dict[str, Any]:
+    """Run one TTS preview generation and remember its outcome."""
+    try:
+        try:
+            audio_result = await youtube_service.tts_service.generate_voice_preview(
+                voice=voice,
+                custom_text=text if text != DEFAULT_PREVIEW_TEXT else None,
+                use_cache=True
+            )
+        except Exception as e:
+            # Nobody may be awaiting this task, so report the failure as a result
+            logger.error(f"Voice preview generation failed for {voice}: {e}", exc_info=e)
+            audio_result = {"status": "error", "error_message": f"TTS generation failed: {str(e)}"}
         
-        # Update job with YouTube URLs
-        job.youtube_url = upload_result["video_url"]
-        job.youtube_video_id = upload_result["video_id"]
-        await db.commit()
+        if audio_result["status"] == "error":
+            _failed_voice_previews[cache_key] = audio_result
+        else:
+            _voice_preview_cache[cache_key] = audio_result
+            _failed_voice_previews.pop(cache_key, None)
+        return audio_result
+    finally:
+        _pending_voice_previews.pop(cache_key, None)
+
+
+def _start_voice_preview(youtube_service: YouTubeService, voice: str, text: str) -> Optional[asyncio.Task]:
+    """
+    Start generating a voice preview in the background unless it is ready.
+    
+    Args:
+        youtube_service: Shared YouTube service
+        voice: Voice name
+        text: Preview text
         
-        return {
-            "success": True,
-            "message": "Processed video uploaded to YouTube successfully", 
-            "job_id": str(job_id),
-            "youtube_data": upload_result,
-            "upload_info": {
-                "original_job_title": job.title,
-                "new_title": title,
-                "tags": tag_list,
-                "category": category,
-                "privacy": privacy
-            }
-        }
+    Returns:
+        The generation task, or None if the preview is already cached
+    """
+    cache_key = _voice_preview_key(voice, text)
+    if cache_key in _voice_preview_cache:
+        return None
+    
+    task = _pending_voice_previews.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_generate_voice_preview(youtube_service, cache_key, voice, text))
+        _pending_voice_previews[cache_key] = task
+    return task
+
+
+async def _get_voice_preview(youtube_service: YouTubeService, voice: str, text: str) -> Dict[str, Any]:
+    """
+    Get a voice preview, waiting for a generation already in flight.
+    
+    Args:
+        youtube_service: Shared YouTube service
+        voice: Voice name
+        text: Preview text
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload video to YouTube: {str(e)}"
-        )
+    Returns:
+        Dict with TTS preview result (status, audio_path, duration, ...)
+    """
+    task = _start_voice_preview(youtube_service, voice, text)
+    if task is None:
+        return _voice_preview_cache[_voice_preview_key(voice, text)]
+    
+    # Shield so a client disconnect does not cancel a generation others await
+    return await asyncio.shield(task)
 
 
 @router.post("/voices/preview")
 async def generate_voice_preview(
     voice: str,
-    text: str = "Hello! This is how I sound. Perfect for your YouTube Shorts.",
-    current_user = Depends(get_current_user)
+    text: str = DEFAULT_PREVIEW_TEXT,
+    current_user = Depends(get_current_user),
+    youtube_service: YouTubeService = Depends(get_youtube_service)
 ) -> Dict[str, Any]:
     """
     Generate a voice preview for the specified voice.
     
+    Generation runs in the background: unless the preview is already
+    cached, the response has status "pending" and the download URL waits
+    for the audio (HEAD on it answers 202 until it is ready).
+    
     Args:
         voice: Voice name to preview (alloy, echo, fable, onyx, nova, shimmer)
         text: Optional custom text to preview (default: standard preview text)
+        youtube_service: Shared YouTube service
         
     Returns:
         Dict with preview audio information and download URL
     """
-    try:
-        youtube_service = YouTubeService()
-        
-        # Validate voice
-        supported_voices = youtube_service.get_supported_voices()
-        if voice not in supported_voices:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported voice: {voice}. Supported voices: {supported_voices}"
-            )
-        
-        # Limit preview text length
-        if len(text) > 200:
-            text = text[:200] + "..."
-        
-        # Generate preview audio with caching
-        audio_result = await youtube_service.tts_service.generate_voice_preview(
-            voice=voice,
-            custom_text=text if text != "Hello! This is how I sound. Perfect for your YouTube Shorts." else None,
-            use_cache=True
-        )
-        
-        if audio_result["status"] == "error":
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to generate voice preview: {audio_result['error_message']}"
-            )
-        
-        # Get voice information
-        voice_info = youtube_service.get_voice_info()
-        voice_details = voice_info["voices"].get(voice, {})
-        
-        return {
-            "status": "success",
-            "voice": voice,
-            "audio_path": audio_result["audio_path"],
-            "duration": audio_result["duration"],
-            "file_size_bytes": audio_result["file_size_bytes"],
-            "voice_info": {
-                "name": voice_details.get("name", voice.title()),
-                "description": voice_details.get("description", ""),
-                "style": voice_details.get("style", ""),
-                "recommended_for": voice_details.get("recommended_for", [])
-            },
-            "preview_text": text,
-            "download_url": f"/api/v1/youtube/voices/preview/{voice}/download",
-            "expires_in_minutes": 15  # Audio files expire in 15 minutes
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Validate voice
+    supported_voices = _supported_voice_set()
+    if voice not in supported_voices:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported voice: {voice}. Supported voices: {sorted(supported_voices)}"
         )
+    
+    # Limit preview text length
+    if len(text) > 200:
+        text = text[:200] + "..."
+    
+    # Kick off preview generation; cached previews are ready immediately
+    pending_task = _start_voice_preview(youtube_service, voice, text)
+    
+    voice_details = _voice_details()[voice]
+    
+    download_url = f"/api/v1/youtube/voices/preview/{voice}/download"
+    if text != DEFAULT_PREVIEW_TEXT:
+        download_url += f"?text={quote(text)}"
+    
+    preview = {
+        "status": "pending",
+        "voice": voice,
+        "voice_info": {
+            "name": voice_details.get("name", voice.title()),
+            "description": voice_details.get("description", ""),
+            "style": voice_details.get("style", ""),
+            "recommended_for": voice_details.get("recommended_for", [])
+        },
+        "preview_text": text,
+        "download_url": download_url,
+        "expires_in_minutes": 15  # Audio files expire in 15 minutes
+    }
+    
+    if pending_task is None:
+        audio_result = _voice_preview_cache[_voice_preview_key(voice, text)]
+        preview.update(
+            status="success",
+            audio_path=audio_result["audio_path"],
+            duration=audio_result["duration"],
+            file_size_bytes=audio_result["file_size_bytes"]
+        )
+    
+    return preview
 
 
 @router.get("/voices/preview/{voice}/download")
 async def download_voice_preview(
+    request: Request,
     voice: str,
-    text: str = "Hello! This is how I sound. Perfect for your YouTube Shorts.",
-    current_user = Depends(get_current_user)
-) -> FileResponse:
+    text: str = DEFAULT_PREVIEW_TEXT,
+    current_user = Depends(get_current_user),
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> Response:
     """
     Download voice preview audio file.
     
+    The audio is fully determined by voice and text, so it is cacheable
+    for a day and a matching If-None-Match gets an empty 304.
+    
     Args:
+        request: Incoming request (for If-None-Match)
         voice: Voice name
         text: Preview text (must match the generated preview)
+        youtube_service: Shared YouTube service
         
     Returns:
-        FileResponse with the audio file
+        Response: The audio file, or 304 Not Modified
     """
-    try:
-        youtube_service = YouTubeService()
-        
-        # Generate the same preview audio with caching
-        audio_result = await youtube_service.tts_service.generate_voice_preview(
-            voice=voice,
-            custom_text=text if text != "Hello! This is how I sound. Perfect for your YouTube Shorts." else None,
-            use_cache=True
-        )
-        
-        if audio_result["status"] == "error":
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate preview audio"
-            )
-        
-        audio_path = audio_result["audio_path"]
-        
-        # Return file with proper headers for audio playback
-        return FileResponse(
-            path=audio_path,
-            media_type="audio/mpeg",
-            filename=f"voice_preview_{voice}.mp3",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
-        )
-        
-    except Exception as e:
+    etag = f'"{hashlib.blake2b(f"{voice}:{text}".encode("utf-8"), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400, immutable"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    # Generate the same preview audio with caching
+    audio_result = await _get_voice_preview(youtube_service, voice, text)
+    
+    if audio_result["status"] == "error":
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to download preview: {str(e)}"
+            detail="Failed to generate preview audio"
         )
+    
+    audio_path = audio_result["audio_path"]
+    
+    # Return file with proper headers for audio playback
+    return PathSendFileResponse(
+        path=audio_path,
+        media_type="audio/mpeg",
+        filename=f"voice_preview_{voice}.mp3",
+        headers=headers
+    )
+
+
+@router.head("/voices/preview/{voice}/download")
+async def get_voice_preview_readiness(
+    voice: str,
+    text: str = DEFAULT_PREVIEW_TEXT,
+    current_user = Depends(get_current_user)
+) -> Response:
+    """
+    Check whether a voice preview is ready to download.
+    
+    Args:
+        voice: Voice name
+        text: Preview text (must match the generated preview)
+        
+    Returns:
+        Response: 200 if ready, 202 while generating, 500 if generation
+        just failed, 404 if never requested
+    """
+    cache_key = _voice_preview_key(voice, text)
+    if cache_key in _voice_preview_cache:
+        return Response(status_code=status.HTTP_200_OK)
+    if cache_key in _pending_voice_previews:
+        return Response(status_code=status.HTTP_202_ACCEPTED)
+    if cache_key in _failed_voice_previews:
+        return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response(status_code=status.HTTP_404_NOT_FOUND)
 
 
 @router.post("/voices/preview/custom")
 async def generate_custom_voice_preview(
     voice: str,
     custom_text: str,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    youtube_service: YouTubeService = Depends(get_youtube_service)
 ) -> Dict[str, Any]:
     """
     Generate voice preview with custom text from user's transcript.
@@ -579,119 +1022,128 @@ async def generate_custom_voice_preview(
     Args:
         voice: Voice name to preview
         custom_text: User's actual transcript text (first 100 characters)
+        youtube_service: Shared YouTube service
         
     Returns:
         Dict with preview information
     """
-    try:
-        # Limit and clean the custom text
-        preview_text = custom_text.strip()[:100]
-        if len(preview_text) < 10:
-            preview_text = "Hello! This is how I sound with your content."
-        
-        # Add ellipsis if truncated
-        if len(custom_text) > 100:
-            preview_text += "..."
-        
-        # Generate preview
-        return await generate_voice_preview(voice, preview_text, current_user)
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate custom preview: {str(e)}"
-        )
+    # Limit and clean the custom text
+    preview_text = custom_text.strip()[:100]
+    if len(preview_text) < 10:
+        preview_text = "Hello! This is how I sound with your content."
+    
+    # Add ellipsis if truncated
+    if len(custom_text) > 100:
+        preview_text += "..."
+    
+    # Generate preview
+    return await generate_voice_preview(voice, preview_text, current_user, youtube_service)
 
 
 @router.delete("/voices/preview/cache")
 async def cleanup_voice_preview_cache(
     max_age_hours: int = 48,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    youtube_service: YouTubeService = Depends(get_youtube_service)
 ) -> Dict[str, Any]:
     """
     Clean up old voice preview cache files.
     
     Args:
         max_age_hours: Maximum age for cache files in hours (default: 48)
+        youtube_service: Shared YouTube service
         
     Returns:
         Dict with cleanup results
     """
-    try:
-        youtube_service = YouTubeService()
-        
-        # Cleanup cache
-        cleanup_result = await youtube_service.tts_service.cleanup_cache(max_age_hours)
-        
-        return {
-            "status": "success",
-            "message": f"Cache cleanup completed",
-            "cleanup_result": cleanup_result
-        }
+    # Cleanup cache; remembered preview results may point at removed files
+    cleanup_result = await youtube_service.tts_service.cleanup_cache(max_age_hours)
+    _voice_preview_cache.clear()
+    _failed_voice_previews.clear()
+    
+    return {
+        "status": "success",
+        "message": f"Cache cleanup completed",
+        "cleanup_result": cleanup_result
+    }
+
+
+def _scan_preview_cache(cache_dir: str) -> Tuple[int, int, List[float]]:
+    """
+    Collect file count, total size and mtimes of cached preview MP3s.
+    
+    Uses os.scandir so each file is stat'ed once; files removed during
+    the scan are skipped.
+    
+    Args:
+        cache_dir: Preview cache directory
         
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to cleanup cache: {str(e)}"
-        )
+    Returns:
+        Tuple of (file count, total size in bytes, modification times)
+    """
+    total_size = 0
+    mtimes = []
+    
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".mp3"):
+                continue
+            try:
+                entry_stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            total_size += entry_stat.st_size
+            mtimes.append(entry_stat.st_mtime)
+    
+    return len(mtimes), total_size, mtimes
 
 
 @router.get("/voices/preview/cache/info")
 async def get_voice_preview_cache_info(
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    youtube_service: YouTubeService = Depends(get_youtube_service)
 ) -> Dict[str, Any]:
     """
     Get information about voice preview cache.
     
+    Args:
+        youtube_service: Shared YouTube service
+        
     Returns:
         Dict with cache information
     """
-    try:
-        youtube_service = YouTubeService()
-        cache_dir = youtube_service.tts_service.cache_dir
-        
-        if not cache_dir.exists():
-            return {
-                "status": "success",
-                "cache_exists": False,
-                "message": "No cache directory found"
-            }
-        
-        # Calculate cache statistics
-        cache_files = list(cache_dir.glob("*.mp3"))
-        total_files = len(cache_files)
-        total_size = sum(f.stat().st_size for f in cache_files if f.exists())
-        
-        # Get oldest and newest files
-        if cache_files:
-            file_ages = [(f, f.stat().st_mtime) for f in cache_files if f.exists()]
-            file_ages.sort(key=lambda x: x[1])
-            
-            import time
-            current_time = time.time()
-            oldest_age_hours = (current_time - file_ages[0][1]) / 3600 if file_ages else 0
-            newest_age_hours = (current_time - file_ages[-1][1]) / 3600 if file_ages else 0
-        else:
-            oldest_age_hours = 0
-            newest_age_hours = 0
-        
+    cache_dir = youtube_service.tts_service.cache_dir
+    
+    if not cache_dir.exists():
         return {
             "status": "success",
-            "cache_exists": True,
-            "cache_directory": str(cache_dir),
-            "total_files": total_files,
-            "total_size_bytes": total_size,
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "oldest_file_age_hours": round(oldest_age_hours, 2),
-            "newest_file_age_hours": round(newest_age_hours, 2),
-            "recommended_cleanup": oldest_age_hours > 24
+            "cache_exists": False,
+            "message": "No cache directory found"
         }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get cache info: {str(e)}"
-        )
+    
+    # Calculate cache statistics in one directory pass, off the event loop
+    total_files, total_size, mtimes = await asyncio.to_thread(_scan_preview_cache, str(cache_dir))
+    
+    # Get oldest and newest file ages
+    if mtimes:
+        current_time = time.time()
+        oldest_age_hours = (current_time - min(mtimes)) / 3600
+        newest_age_hours = (current_time - max(mtimes)) / 3600
+    else:
+        oldest_age_hours = 0
+        newest_age_hours = 0
+    
+    return {
+        "status": "success",
+        "cache_exists": True,
+        "cache_directory": str(cache_dir),
+        "total_files": total_files,
+        "total_size_bytes": total_size,
+        "total_size_mb": round(total_size / (1024 * 1024), 2),
+        "oldest_file_age_hours": round(oldest_age_hours, 2),
+        "newest_file_age_hours": round(newest_age_hours, 2),
+        "recommended_cleanup": oldest_age_hours > 24
+    }
 
 
 @router.get("/auth-url")
@@ -700,7 +1152,6 @@ async def get_youtube_auth_url(
     db: AsyncSession = Depends(get_db)
 ):
     """Get YouTube OAuth authorization URL"""
-    from app.services.secret_service import SecretService
     secret_service = SecretService(db)
     youtube_service = YouTubeService(user_id=current_user.id, secret_service=secret_service)
     try:
@@ -721,7 +1172,6 @@ async def youtube_oauth_callback(
     db: AsyncSession = Depends(get_db)
 ):
     """Handle YouTube OAuth callback"""
-    from app.services.secret_service import SecretService
     secret_service = SecretService(db)
     youtube_service = YouTubeService(user_id=current_user.id, secret_service=secret_service)
     try:
@@ -749,16 +1199,15 @@ async def get_youtube_auth_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Get YouTube authentication status"""
-    from app.services.secret_service import SecretService
     secret_service = SecretService(db)
     youtube_service = YouTubeService(user_id=current_user.id, secret_service=secret_service)
     try:
-        status = await youtube_service.get_auth_status(current_user.id)
+        auth_status = await youtube_service.get_auth_status(current_user.id)
         return {
-            "is_authenticated": status["is_authenticated"],
-            "channel_id": status.get("channel_id"),
-            "channel_title": status.get("channel_title"),
-            "authenticated_at": status.get("authenticated_at")
+            "is_authenticated": auth_status["is_authenticated"],
+            "channel_id": auth_status.get("channel_id"),
+            "channel_title": auth_status.get("channel_title"),
+            "authenticated_at": auth_status.get("authenticated_at")
         }
     except Exception as e:
         return {
@@ -2,12 +2,15 @@
 Core functionality for YouTube Shorts Creator
 """
 
-from app.core.dependencies import get_current_user, verify_file_upload
+from app.core.dependencies import get_current_user, verify_file_upload, verify_upload_type
+from app.core.http_cache import etag_matches
 from app.core.middleware import add_cors_middleware, add_security_middleware
 
 __all__ = [
     "get_current_user",
     "verify_file_upload", 
+    "verify_upload_type",
+    "etag_matches",
     "add_cors_middleware",
     "add_security_middleware"
 ] 
\ No newline at end of file
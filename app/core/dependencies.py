@@ -17,6 +17,8 @@ from app.models.upload import Upload
 from app.models.user import User
 from app.schemas.upload import FileUploadInfo
 from app.services.auth import AuthService
+from app.services.file_service import FileService
+from app.services.youtube_video_service import YouTubeVideoService
 
 # Configure logger for dependencies
 logger = logging.getLogger(__name__)
@@ -78,6 +80,84 @@ async def get_current_user(
     return user
 
 
+def get_file_service(db: AsyncSession = Depends(get_db)) -> FileService:
+    """
+    Get a file service bound to the request's database session.
+    
+    FileService reuses the shared S3 service, so this only wraps the session.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        FileService: File service for this request
+    """
+    return FileService(db)
+
+
+def get_youtube_video_service(db: AsyncSession = Depends(get_db)) -> YouTubeVideoService:
+    """
+    Get a YouTube video service bound to the request's database session.
+    
+    YouTubeVideoService reuses the shared S3 service, so this only wraps the session.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        YouTubeVideoService: YouTube video service for this request
+    """
+    return YouTubeVideoService(db)
+
+
+def verify_upload_type(
+    filename: Optional[str],
+    content_type: Optional[str],
+    expected_type: str
+) -> None:
+    """
+    Reject an upload from its filename and declared content type alone.
+    
+    This runs before verify_file_upload so mismatched uploads are refused
+    without touching the spooled file body, and before issuing presigned
+    upload URLs.
+    
+    Args:
+        filename: Client-supplied filename
+        content_type: Client-supplied content type
+        expected_type: Expected file type (video/transcript)
+        
+    Raises:
+        HTTPException: If the upload is not of the expected type
+    """
+    if not filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Filename is required"
+        )
+    
+    file_extension = filename.rpartition(".")[2].lower()
+    content_type = content_type or ""
+    
+    if expected_type == "video":
+        is_expected = (
+            file_extension in settings.allowed_video_types_set
+            and (
+                not content_type
+                or content_type.startswith("video/")
+                or content_type == "application/octet-stream"
+            )
+        )
+    else:
+        is_expected = file_extension in settings.allowed_transcript_types_set
+    
+    if not is_expected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Only {expected_type} files are allowed for this endpoint"
+        )
+
+
 def verify_file_upload(file: UploadFile) -> FileUploadInfo:
     """
     Verify uploaded file meets requirements.
@@ -97,13 +177,14 @@ def verify_file_upload(file: UploadFile) -> FileUploadInfo:
             detail="No file provided"
         )
     
-    # Check file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
+    # Check file size; Starlette records it while parsing the multipart body
+    file_size = file.size
+    if file_size is None:
+        file.file.seek(0, 2)  # Seek to end
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset to beginning
     
-    max_size_bytes = settings.max_file_size_mb * 1024 * 1024
-    if file_size > max_size_bytes:
+    if file_size > settings.max_file_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
@@ -116,11 +197,11 @@ def verify_file_upload(file: UploadFile) -> FileUploadInfo:
             detail="Filename is required"
         )
     
-    file_extension = file.filename.split(".")[-1].lower()
+    file_extension = file.filename.rpartition(".")[2].lower()
     
     # Determine file type and validate
-    is_video = file_extension in settings.allowed_video_types
-    is_transcript = file_extension in settings.allowed_transcript_types
+    is_video = file_extension in settings.allowed_video_types_set
+    is_transcript = file_extension in settings.allowed_transcript_types_set
     
     if not (is_video or is_transcript):
         allowed_types = settings.allowed_video_types + settings.allowed_transcript_types
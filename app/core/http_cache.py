@@ -0,0 +1,26 @@
+"""
+HTTP conditional request helpers
+"""
+
+from typing import Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header value against an ETag.
+    
+    Uses weak comparison, so W/ prefixes on either side are ignored.
+    
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag of the resource
+        
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
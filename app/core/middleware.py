@@ -11,6 +11,60 @@ from app.config import get_settings
 settings = get_settings()
 
 
+def add_error_handling_middleware(app: FastAPI) -> None:
+    """
+    Add middleware that turns unexpected exceptions into a 500 response.
+    
+    Registered before the CORS middleware so that CORS wraps it and the
+    500 carries the same CORS headers as any other response.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    import logging
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    
+    logger = logging.getLogger("app.middleware")
+    
+    class ErrorHandlingMiddleware:
+        def __init__(self, app):
+            self.app = app
+        
+        async def __call__(self, scope, receive, send):
+            if scope["type"] != "http":
+                await self.app(scope, receive, send)
+                return
+            
+            response_started = False
+            
+            async def send_wrapper(message):
+                nonlocal response_started
+                if message["type"] == "http.response.start":
+                    response_started = True
+                await send(message)
+            
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as exc:
+                request = Request(scope)
+                logger.error(f"Unhandled error for {request.method} {request.url}: {exc}", exc_info=exc)
+                
+                # Too late to replace a response that is already streaming
+                if response_started:
+                    raise
+                
+                response = JSONResponse(
+                    status_code=500,
+                    content={
+                        "detail": f"Internal server error: {str(exc)}" if settings.debug else "Internal server error"
+                    }
+                )
+                await response(scope, receive, send)
+    
+    app.add_middleware(ErrorHandlingMiddleware)
+
+
 def add_cors_middleware(app: FastAPI) -> None:
     """
     Add CORS middleware to FastAPI app.
@@ -121,13 +175,12 @@ def add_file_size_middleware(app: FastAPI) -> None:
     class FileSizeMiddleware(BaseHTTPMiddleware):
         async def dispatch(self, request: Request, call_next):
             # Check content length for file uploads
-            if request.method == "POST" and "/upload" in str(request.url):
+            if request.method == "POST" and "/upload" in request.url.path:
                 content_length = request.headers.get("content-length")
                 if content_length:
                     content_length = int(content_length)
-                    max_size = settings.max_file_size_mb * 1024 * 1024
                     
-                    if content_length > max_size:
+                    if content_length > settings.max_file_size_bytes:
                         return JSONResponse(
                             status_code=413,
                             content={
@@ -6,6 +6,7 @@ import asyncio
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy import MetaData
 
 from app.config import get_settings
@@ -17,29 +18,42 @@ engine = None
 AsyncSessionLocal = None
 
 def _create_engine():
-    """Create a new database engine with anti-caching settings."""
+    """Create a new database engine."""
+    connect_args = {
+        "server_settings": {
+            "application_name": "youtube_shorts_api",
+        }
+    }
+    if settings.database_pgbouncer:
+        # PgBouncer in transaction mode can hand each statement a different
+        # server connection, so prepared statements must not be reused
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["statement_cache_size"] = 0
+    
     return create_async_engine(
         settings.database_url.replace("postgresql://", "postgresql+asyncpg://"),
         echo=settings.debug,
         future=True,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
         pool_pre_ping=True,  # Validate connections before use
-        pool_recycle=3600,   # Recycle connections every hour
-        connect_args={
-            "prepared_statement_cache_size": 0,  # Disable prepared statement caching
-            "statement_cache_size": 0,           # Disable statement caching
-            "server_settings": {
-                "application_name": "youtube_shorts_api",
-            }
-        }
+        pool_recycle=settings.database_pool_recycle,
+        connect_args=connect_args
     )
 
 def _initialize_database_components():
     """Initialize or reinitialize database engine and session factory."""
     global engine, AsyncSessionLocal
     
-    # Dispose of existing engine if it exists
+    # Dispose of existing engine if it exists; without a running loop there
+    # are no checked-out async connections to close, so just drop it
     if engine is not None:
-        asyncio.create_task(engine.dispose())
+        try:
+            asyncio.get_running_loop().create_task(engine.dispose())
+        except RuntimeError:
+            pass
     
     # Create new engine and session factory
     engine = _create_engine()
@@ -74,24 +88,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
     
+    Services and endpoints commit their own writes, so read-only requests
+    never send a COMMIT.
+    
     Yields:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            # Only commit if there are pending changes
-            if session.dirty or session.new or session.deleted:
-                await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+def get_pool_status() -> dict:
+    """
+    Get a snapshot of the database connection pool usage.
+    
+    Returns:
+        dict: Configured limits and current connection counts
+    """
+    pool = engine.pool
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.database_max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
 
 
 async def init_database() -> None:
-    """Initialize database tables."""
+    """
+    Initialize database tables.
+    
+    Indexes on tables that already exist are built separately, without
+    blocking writes, by running ``python -m app.db_indexes``.
+    """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -0,0 +1,73 @@
+"""
+One-off index builder for existing databases
+
+Startup only creates missing tables, so indexes added to tables that already
+exist are built here, with CREATE INDEX CONCURRENTLY so writes are not
+blocked while they build. Run it once after deploying a schema change:
+
+    python -m app.db_indexes
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app import database
+
+logger = logging.getLogger(__name__)
+
+# Required by the trigram search indexes on videos
+EXTENSION_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+]
+
+# Keep in step with the indexes declared on the models; the trigram indexes
+# live only here so that startup never depends on pg_trgm
+INDEX_STATEMENTS = [
+    # Per-user lookups by S3 key (get_by_s3_key, existence checks)
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_user_s3_key "
+    "ON videos (user_id, s3_key)",
+    # Per-user listing newest first; soft-deleted rows are left out
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_user_created_at_active "
+    "ON videos (user_id, created_at DESC) WHERE deleted_at IS NULL",
+    # Trigram indexes so ILIKE '%term%' search can use an index
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_filename_trgm "
+    "ON videos USING gin (filename gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_original_filename_trgm "
+    "ON videos USING gin (original_filename gin_trgm_ops)",
+]
+
+
+async def create_indexes() -> None:
+    """
+    Create the extensions and indexes that startup does not build.
+    
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so each
+    statement runs on an AUTOCOMMIT connection. A build that fails leaves an
+    invalid index behind, which IF NOT EXISTS would then skip; drop it and
+    run this again.
+    """
+    autocommit_engine = database.engine.execution_options(isolation_level="AUTOCOMMIT")
+    
+    async with autocommit_engine.connect() as conn:
+        for statement in EXTENSION_STATEMENTS + INDEX_STATEMENTS:
+            logger.info(f"Running: {statement}")
+            await conn.execute(text(statement))
+
+
+async def main() -> None:
+    """Build the indexes and close the connection pool."""
+    try:
+        await create_indexes()
+        logger.info("Indexes are up to date")
+    finally:
+        await database.close_database()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    asyncio.run(main())
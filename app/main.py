@@ -7,20 +7,24 @@ import warnings
 from contextlib import asynccontextmanager
 from datetime import datetime
 
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import get_settings
-from app.database import init_database, close_database
+from app.database import init_database, close_database, get_pool_status
 from app.core.middleware import (
+    add_error_handling_middleware,
     add_cors_middleware,
     add_security_middleware,
     add_request_logging_middleware,
     add_file_size_middleware
 )
-from app.core.dependencies import verify_upload_directory
+from app.core.dependencies import verify_upload_directory, get_current_user
+from app.services.s3_service import shutdown_s3_executor
+from app.services.youtube_upload_queue import start_upload_workers, stop_upload_workers
+from app.models.user import User
 from app.schemas.upload import HealthCheck, ApiInfo
 
 # Import API routers
@@ -64,6 +68,8 @@ async def lifespan(app: FastAPI):
         logger.error("Upload directory is not accessible")
         raise RuntimeError("Upload directory setup failed")
     
+    start_upload_workers()
+    
     logger.info("Application startup complete")
     
     yield
@@ -71,12 +77,18 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down YouTube Shorts Creator API...")
     
+    # Workers may still be finishing an upload that needs the database and
+    # S3, so stop them before closing either
+    await stop_upload_workers()
+    
     try:
         await close_database()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error during database shutdown: {e}")
     
+    shutdown_s3_executor()
+    
     logger.info("Application shutdown complete")
 
 
@@ -88,6 +100,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -125,10 +138,13 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     
     return JSONResponse(
         status_code=exc.status_code,
-        content={"detail": exc.detail}
+        content={"detail": exc.detail},
+        headers=getattr(exc, "headers", None)
     )
 
-# Add middleware
+# Add middleware. The last one added is outermost, so error handling goes
+# first to sit inside CORS and give 500s the usual CORS headers
+add_error_handling_middleware(app)
 add_cors_middleware(app)
 add_security_middleware(app)
 add_request_logging_middleware(app)
@@ -224,6 +240,22 @@ async def health_check() -> HealthCheck:
     )
 
 
+@app.get("/api/v1/health/db-pool")
+async def database_pool_status(current_user: User = Depends(get_current_user)) -> dict:
+    """
+    Database connection pool status, for tuning pool size against traffic.
+    
+    Requires authentication, since pool usage reveals load and capacity.
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        dict: Pool limits and current connection counts
+    """
+    return get_pool_status()
+
+
 @app.get("/api/v1/info", response_model=ApiInfo)
 async def api_info() -> ApiInfo:
     """
@@ -246,6 +278,8 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=settings.debug,
         log_level="debug" if settings.debug else "info"
     ) 
\ No newline at end of file
@@ -2,7 +2,7 @@
 Job model for tracking YouTube Short creation with S3 support
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID, uuid4
 
@@ -13,6 +13,10 @@ from sqlalchemy.sql import func
 
 from app.database import Base
 
+# How long after completion a recorded final video is trusted to still be on
+# disk, so handlers can skip a stat() on it
+FINAL_VIDEO_TRUST_SECONDS = 3600
+
 
 class Job(Base):
     """Job model for tracking YouTube Short creation progress with S3 storage."""
@@ -116,4 +120,13 @@ class Job(Base):
     @property
     def can_cleanup_temp_files(self) -> bool:
         """Check if temp files can be cleaned up."""
-        return self.is_processing_complete and not self.temp_files_cleaned 
\ No newline at end of file
+        return self.is_processing_complete and not self.temp_files_cleaned
+    
+    @property
+    def final_video_recently_written(self) -> bool:
+        """Check if the local final video was recorded recently enough to trust without a stat()."""
+        return (
+            self.file_size_mb is not None
+            and self.completed_at is not None
+            and datetime.now(timezone.utc) - self.completed_at < timedelta(seconds=FINAL_VIDEO_TRUST_SECONDS)
+        ) 
\ No newline at end of file
@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
 from decimal import Decimal
 
-from sqlalchemy import Column, String, BigInteger, DECIMAL, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, BigInteger, DECIMAL, Text, DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -19,6 +19,18 @@ class Video(Base):
     """Video model for tracking videos stored in S3 with metadata."""
     
     __tablename__ = "videos"
+    # The pg_trgm search indexes are built outside startup by app.db_indexes
+    __table_args__ = (
+        # Per-user lookups by S3 key (get_by_s3_key, existence checks)
+        Index("ix_videos_user_s3_key", "user_id", "s3_key"),
+        # Per-user listing newest first; soft-deleted rows are left out
+        Index(
+            "ix_videos_user_created_at_active",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+    )
     
     # Primary key
     id: Mapped[UUID] = mapped_column(
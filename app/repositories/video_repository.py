@@ -4,18 +4,37 @@ Video repository for database operations
 
 import math
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Set
 from uuid import UUID
 
-from sqlalchemy import desc, asc, func, or_, and_, extract
+from sqlalchemy import desc, asc, func, or_, and_, extract, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.models.upload import Upload
 from app.models.video import Video
 from app.schemas.video import VideoCreate, VideoUpdate
 
 
+# Columns needed to build a VideoResponse; list queries select only these
+# instead of materializing full ORM entities.
+VIDEO_RESPONSE_COLUMNS = (
+    Video.id,
+    Video.filename,
+    Video.original_filename,
+    Video.s3_key,
+    Video.s3_url,
+    Video.content_type,
+    Video.file_size,
+    Video.duration,
+    Video.thumbnail_url,
+    Video.video_metadata,
+    Video.created_at,
+)
+
+
 class VideoRepository:
     """Repository for video database operations."""
     
@@ -30,7 +49,7 @@ class VideoRepository:
         search: Optional[str] = None,
         sort_by: str = "created_at",
         sort_order: str = "desc"
-    ) -> Tuple[List[Video], int]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Get paginated videos for user with optional search.
         
@@ -43,37 +62,26 @@ class VideoRepository:
             sort_order: Sort order (asc/desc)
             
         Returns:
-            Tuple of (videos list, total count)
+            Tuple of (video row dicts, total count)
         """
-        # Base query
-        query = select(Video).where(
-            and_(
-                Video.user_id == user_id,
-                Video.deleted_at.is_(None)
-            )
-        )
+        filters = [
+            Video.user_id == user_id,
+            Video.deleted_at.is_(None)
+        ]
         
         # Search functionality
         if search:
-            search_filter = or_(
+            filters.append(or_(
                 Video.filename.ilike(f"%{search}%"),
                 Video.original_filename.ilike(f"%{search}%")
-            )
-            query = query.where(search_filter)
-        
-        # Count query for total
-        count_query = select(func.count(Video.id)).where(
-            and_(
-                Video.user_id == user_id,
-                Video.deleted_at.is_(None)
-            )
-        )
-        if search:
-            count_query = count_query.where(search_filter)
+            ))
         
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total_count = count_result.scalar()
+        # Total count rides along on every row via a window function,
+        # so one query returns both the page and the count
+        query = select(
+            *VIDEO_RESPONSE_COLUMNS,
+            func.count().over().label("total_count")
+        ).where(and_(*filters))
         
         # Sorting
         sort_column = getattr(Video, sort_by, Video.created_at)
@@ -88,15 +96,57 @@ class VideoRepository:
         
         # Execute query
         result = await self.db.execute(query)
-        videos = result.scalars().all()
+        rows = result.mappings().all()
+        
+        if rows:
+            total_count = rows[0]["total_count"]
+        elif offset:
+            # Past the last page there are no rows to carry the count
+            count_result = await self.db.execute(
+                select(func.count(Video.id)).where(and_(*filters))
+            )
+            total_count = count_result.scalar()
+        else:
+            total_count = 0
         
-        return list(videos), total_count
+        videos = [
+            {key: value for key, value in row.items() if key != "total_count"}
+            for row in rows
+        ]
+        return videos, total_count
+    
+    async def get_list_version(self, user_id: UUID) -> Tuple[Optional[datetime], int]:
+        """
+        Get a cheap fingerprint of the user's video list.
+        
+        Any insert, update or soft delete changes the latest updated_at or
+        the count, so the pair identifies a version of the list.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Tuple of (latest updated_at or None, active video count)
+        """
+        query = select(
+            func.max(Video.updated_at),
+            func.count(Video.id)
+        ).where(
+            and_(
+                Video.user_id == user_id,
+                Video.deleted_at.is_(None)
+            )
+        )
+        
+        result = await self.db.execute(query)
+        latest_updated_at, count = result.one()
+        return latest_updated_at, count
     
     async def get_recent_videos(
         self,
         user_id: UUID,
         limit: int = 5
-    ) -> List[Video]:
+    ) -> List[Dict[str, Any]]:
         """
         Get recent videos for user.
         
@@ -105,9 +155,9 @@ class VideoRepository:
             limit: Number of recent videos to return
             
         Returns:
-            List of recent videos
+            List of recent video row mappings
         """
-        query = select(Video).where(
+        query = select(*VIDEO_RESPONSE_COLUMNS).where(
             and_(
                 Video.user_id == user_id,
                 Video.deleted_at.is_(None)
@@ -115,7 +165,7 @@ class VideoRepository:
         ).order_by(desc(Video.created_at)).limit(limit)
         
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return list(result.mappings().all())
     
     async def get_by_id(
         self,
@@ -169,6 +219,40 @@ class VideoRepository:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def get_with_upload(
+        self,
+        video_id: UUID,
+        user_id: UUID
+    ) -> Tuple[Optional[Video], Optional[Upload]]:
+        """
+        Get video by ID for specific user together with its upload record.
+        
+        The upload is matched on S3 key via an outer join, so both are
+        fetched in a single query.
+        
+        Args:
+            video_id: Video ID
+            user_id: User ID to ensure ownership
+            
+        Returns:
+            Tuple of (video or None, matching upload or None)
+        """
+        query = select(Video, Upload).outerjoin(
+            Upload, Upload.s3_key == Video.s3_key
+        ).where(
+            and_(
+                Video.id == video_id,
+                Video.user_id == user_id,
+                Video.deleted_at.is_(None)
+            )
+        ).limit(1)
+        
+        result = await self.db.execute(query)
+        row = result.first()
+        if not row:
+            return None, None
+        return row.Video, row.Upload
+    
     async def create_video(self, video_data: VideoCreate) -> Video:
         """
         Create new video record.
@@ -185,6 +269,32 @@ class VideoRepository:
         await self.db.refresh(video)
         return video
     
+    async def bulk_create_videos(self, videos: List[VideoCreate]) -> List[Dict[str, Any]]:
+        """
+        Create many video records with a single INSERT and one commit.
+        
+        Rows whose S3 key is already present are skipped rather than
+        failing the whole batch.
+        
+        Args:
+            videos: Video creation data
+            
+        Returns:
+            List of dicts with id, filename and s3_key for each inserted row
+        """
+        if not videos:
+            return []
+        
+        result = await self.db.execute(
+            pg_insert(Video)
+            .values([video.model_dump() for video in videos])
+            .on_conflict_do_nothing(index_elements=[Video.s3_key])
+            .returning(Video.id, Video.filename, Video.s3_key)
+        )
+        created = [dict(row) for row in result.mappings().all()]
+        await self.db.commit()
+        return created
+    
     async def update_video(
         self,
         video_id: UUID,
@@ -202,18 +312,20 @@ class VideoRepository:
         Returns:
             Updated video if found and owned by user, None otherwise
         """
-        video = await self.get_by_id(video_id, user_id)
-        if not video:
-            return None
-        
-        # Update fields
-        update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(video, field, value)
-        
-        video.updated_at = func.now()
+        result = await self.db.execute(
+            update(Video)
+            .where(
+                and_(
+                    Video.id == video_id,
+                    Video.user_id == user_id,
+                    Video.deleted_at.is_(None)
+                )
+            )
+            .values(**update_data.model_dump(exclude_unset=True), updated_at=func.now())
+            .returning(Video)
+        )
+        video = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(video)
         return video
     
     async def soft_delete_video(
@@ -231,13 +343,19 @@ class VideoRepository:
         Returns:
             True if deleted, False if not found
         """
-        video = await self.get_by_id(video_id, user_id)
-        if not video:
-            return False
-        
-        video.deleted_at = func.now()
+        result = await self.db.execute(
+            update(Video)
+            .where(
+                and_(
+                    Video.id == video_id,
+                    Video.user_id == user_id,
+                    Video.deleted_at.is_(None)
+                )
+            )
+            .values(deleted_at=func.now())
+        )
         await self.db.commit()
-        return True
+        return result.rowcount > 0
     
     async def get_video_stats(self, user_id: UUID) -> Dict[str, Any]:
         """
@@ -311,4 +429,32 @@ class VideoRepository:
         
         result = await self.db.execute(query)
         count = result.scalar()
-        return count > 0 
\ No newline at end of file
+        return count > 0
+    
+    async def get_existing_s3_keys(self, user_id: UUID, s3_keys: List[str]) -> Set[str]:
+        """
+        Get the subset of S3 keys that are already tracked for user.
+        
+        Resolves existence for a whole batch of keys in one query instead
+        of one check_s3_key_exists round-trip per key.
+        
+        Args:
+            user_id: User ID
+            s3_keys: S3 object keys to check
+            
+        Returns:
+            Set of keys that already have a video record
+        """
+        if not s3_keys:
+            return set()
+        
+        query = select(Video.s3_key).where(
+            and_(
+                Video.user_id == user_id,
+                Video.s3_key.in_(s3_keys),
+                Video.deleted_at.is_(None)
+            )
+        )
+        
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
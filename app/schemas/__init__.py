@@ -10,7 +10,7 @@ from app.schemas.secret import (
     SecretResponse,
     SecretStatusResponse
 )
-from app.schemas.upload import UploadResponse, TranscriptUpload
+from app.schemas.upload import UploadResponse, TranscriptUpload, TranscriptBatchUpload
 from app.schemas.auth import (
     AuthResponse,
     MessageResponse,
@@ -37,6 +37,7 @@ __all__ = [
     "SecretStatusResponse",
     "UploadResponse", 
     "TranscriptUpload",
+    "TranscriptBatchUpload",
     "AuthResponse", 
     "MessageResponse", 
     "PasswordChange", 
@@ -2,10 +2,16 @@
 Pydantic schemas for upload operations
 """
 
+import re
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from fastapi import Form
+from pydantic import BaseModel, Field, field_validator
+
+# One comma-separated tag with surrounding whitespace excluded
+_TAG = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
 
 
 class UploadResponse(BaseModel):
@@ -22,6 +28,31 @@ class UploadResponse(BaseModel):
         from_attributes = True
 
 
+class PresignedUploadRequest(BaseModel):
+    """Schema for requesting a presigned direct-to-S3 upload."""
+    
+    filename: str = Field(..., min_length=1, max_length=255, description="Original filename")
+    content_type: str = Field("video/mp4", max_length=100, description="MIME type of the file")
+    custom_name: Optional[str] = Field(None, max_length=255, description="Custom name for the file")
+
+
+class PresignedUploadResponse(BaseModel):
+    """Schema for a presigned direct-to-S3 upload."""
+    
+    upload_id: UUID
+    url: str
+    fields: Dict[str, str]
+    expires_in: int
+
+
+class PresignedUploadComplete(BaseModel):
+    """Schema for confirming a presigned direct-to-S3 upload."""
+    
+    upload_id: UUID
+    filename: str = Field(..., min_length=1, max_length=255, description="Original filename")
+    custom_name: Optional[str] = Field(None, max_length=255, description="Custom name for the file")
+
+
 class TranscriptUpload(BaseModel):
     """Schema for transcript text upload."""
     
@@ -33,6 +64,17 @@ class TranscriptUpload(BaseModel):
     )
 
 
+class TranscriptBatchUpload(BaseModel):
+    """Schema for uploading several transcripts in one request."""
+    
+    transcripts: List[TranscriptUpload] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Transcripts to upload"
+    )
+
+
 class FileUploadInfo(BaseModel):
     """Schema for file upload information."""
     
@@ -43,6 +85,65 @@ class FileUploadInfo(BaseModel):
     error_message: str = ""
 
 
+class S3ConfigStatus(BaseModel):
+    """Schema for S3 configuration status."""
+    
+    aws_access_key_id_configured: bool
+    aws_secret_access_key_configured: bool
+    s3_bucket_name_configured: bool
+    aws_region: str
+    s3_accelerate: bool
+    s3_bucket_name: str
+    all_configured: bool
+    s3_connection_status: str
+    s3_service_available: bool
+
+
+class S3ConfigCheckResponse(BaseModel):
+    """Schema for S3 configuration check response."""
+    
+    status: str = "success"
+    s3_configuration: S3ConfigStatus
+    recommendations: List[str]
+
+
+class TempCleanupResult(BaseModel):
+    """Schema for temporary file cleanup statistics."""
+    
+    s3_cleanup: Dict[str, Any]
+    database_records_deleted: int
+    total_temp_files_processed: Optional[int] = None  # Only on success
+    error: Optional[str] = None  # Only on failure
+
+
+class TempCleanupResponse(BaseModel):
+    """Schema for temporary file cleanup response."""
+    
+    status: str = "success"
+    message: str
+    cleanup_result: TempCleanupResult
+
+
+class UploadStats(BaseModel):
+    """Schema for upload statistics."""
+    
+    total_uploads: int
+    video_uploads: int
+    transcript_uploads: int
+    temporary_files: int
+    permanent_files: int
+    s3_bucket: Optional[str] = None  # Only on success; null if S3 is unconfigured
+    s3_configured: bool
+    error: Optional[str] = None  # Only on failure
+
+
+class UploadStatsResponse(BaseModel):
+    """Schema for upload statistics response."""
+    
+    status: str = "success"
+    statistics: UploadStats
+
+
 class SupportedVoices(BaseModel):
     """Schema for supported TTS voices."""
     
@@ -57,6 +158,44 @@ class SupportedVoices(BaseModel):
     default_voice: str = "alloy"
 
 
+class YouTubeUploadMetadata(BaseModel):
+    """Schema for YouTube upload metadata sent as multipart form fields."""
+    
+    title: str
+    description: str = ""
+    tags: List[str] = Field(default_factory=list)
+    category: str = "entertainment"
+    privacy: str = "public"
+    
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, v: Any) -> Any:
+        """Accept tags as a comma-separated string as well as a list."""
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return _TAG.findall(v)
+        return v
+    
+    @classmethod
+    def as_form(
+        cls,
+        title: str = Form(...),
+        description: str = Form(""),
+        tags: str = Form(""),
+        category: str = Form("entertainment"),
+        privacy: str = Form("public")
+    ) -> "YouTubeUploadMetadata":
+        """Build the metadata from form fields; use as Depends(YouTubeUploadMetadata.as_form)."""
+        return cls(
+            title=title,
+            description=description,
+            tags=tags,
+            category=category,
+            privacy=privacy
+        )
+
+
 class HealthCheck(BaseModel):
     """Schema for health check response."""
     
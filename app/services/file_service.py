@@ -2,12 +2,16 @@
 File service for handling uploads and file management with S3 storage
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 
+from botocore.response import StreamingBody
+from cachetools import TTLCache
 from fastapi import UploadFile, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, update, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.config import get_settings
 from app.models.upload import Upload
@@ -15,6 +19,24 @@ from app.schemas.upload import UploadResponse
 
 settings = get_settings()
 
+# Presigned URLs are dropped from the cache this many seconds before they
+# expire, so any URL handed out stays valid for at least this long.
+PRESIGNED_URL_REFRESH_MARGIN = 600
+
+# Maximum concurrent S3 PUTs for a single batch upload request
+BATCH_UPLOAD_CONCURRENCY = 32
+
+# Process-wide cache of presigned download URLs keyed by upload ID
+_presigned_url_cache: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=max(settings.s3_presigned_url_expiry - PRESIGNED_URL_REFRESH_MARGIN, 1)
+)
+
+
+# Process-wide cache of upload responses keyed by upload ID. Rows only change
+# through delete_upload and move_temp_to_permanent, which invalidate entries.
+_upload_response_cache: TTLCache = TTLCache(maxsize=50_000, ttl=300)
+
 
 class FileService:
     """Service for file upload and management operations using S3 storage."""
@@ -27,8 +49,8 @@ class FileService:
     def _init_s3_service(self):
         """Initialize S3 service with proper error handling."""
         try:
-            from app.services.s3_service import S3Service
-            self.s3_service = S3Service()
+            from app.services.s3_service import get_s3_service
+            self.s3_service = get_s3_service()
         except ValueError as e:
             # S3 not configured - this will be handled in individual methods
             self.s3_service = None
@@ -60,6 +82,29 @@ class FileService:
                     detail="S3 storage service unavailable. Please check AWS configuration and credentials."
                 )
     
+    async def _insert_upload(self, **values: Any) -> Optional[Upload]:
+        """
+        Insert an upload record and return it in a single round trip.
+        
+        Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so server-side
+        defaults come back without a follow-up SELECT.
+        
+        Args:
+            **values: Column values for the new upload
+            
+        Returns:
+            The inserted Upload, or None if the ID already exists
+        """
+        result = await self.db.execute(
+            pg_insert(Upload)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[Upload.id])
+            .returning(Upload)
+        )
+        upload = result.scalar_one_or_none()
+        await self.db.commit()
+        return upload
+    
     async def save_uploaded_file(
         self, 
         file: UploadFile, 
@@ -67,7 +112,8 @@ class FileService:
         user_id: Optional[UUID] = None,
         job_id: Optional[UUID] = None,
         is_temp: bool = True,
-        custom_name: Optional[str] = None
+        custom_name: Optional[str] = None,
+        chunk_size: Optional[int] = None
     ) -> UploadResponse:
         """
         Save uploaded file to S3 and database.
@@ -79,6 +125,7 @@ class FileService:
             job_id: Optional job ID to associate with upload
             is_temp: Whether this is a temporary file
             custom_name: Optional custom name for the file
+            chunk_size: Optional multipart part size in bytes
             
         Returns:
             UploadResponse: Upload information
@@ -101,11 +148,12 @@ class FileService:
                 is_temp=is_temp,
                 user_id=user_id,
                 job_id=job_id,
-                custom_name=custom_name
+                custom_name=custom_name,
+                chunk_size=chunk_size
             )
             
             # Create database record
-            upload = Upload(
+            upload = await self._insert_upload(
                 id=upload_id,
                 filename=s3_result['s3_key'].split('/')[-1],  # Extract filename from S3 key
                 original_filename=file.filename or "",
@@ -117,10 +165,8 @@ class FileService:
                 is_temp=is_temp,
                 job_id=job_id
             )
-            
-            self.db.add(upload)
-            await self.db.commit()
-            await self.db.refresh(upload)
+            if upload is None:
+                raise ValueError(f"Upload {upload_id} already exists")
             
             return UploadResponse(
                 id=upload.id,
@@ -149,6 +195,136 @@ class FileService:
                 detail=f"Failed to save file: {str(e)}"
             )
     
+    async def create_presigned_upload(
+        self,
+        filename: str,
+        content_type: str,
+        file_type: str,
+        user_id: UUID,
+        custom_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a presigned POST for uploading a temporary file directly to S3.
+        
+        Args:
+            filename: Original filename
+            content_type: Content type the client will send
+            file_type: Type of file (video/transcript)
+            user_id: User ID for organization
+            custom_name: Optional custom name for the file
+            
+        Returns:
+            Dict with upload ID, POST url, form fields and expiry
+        """
+        # Check S3 availability
+        self._check_s3_available()
+        
+        upload_id = uuid4()
+        s3_key = self.s3_service._generate_s3_key(
+            filename, file_type, upload_id, is_temp=True, user_id=user_id, custom_name=custom_name
+        )
+        
+        presigned = await self.s3_service.generate_presigned_post(
+            s3_key,
+            content_type=content_type,
+            max_size_bytes=settings.max_file_size_mb * 1024 * 1024,
+            metadata={
+                'upload-id': str(upload_id),
+                'file-type': file_type,
+                'user-id': str(user_id),
+                'is-temp': 'true'
+            }
+        )
+        
+        return {
+            "upload_id": upload_id,
+            "url": presigned["url"],
+            "fields": presigned["fields"],
+            "expires_in": settings.s3_presigned_url_expiry
+        }
+    
+    async def complete_presigned_upload(
+        self,
+        upload_id: UUID,
+        filename: str,
+        file_type: str,
+        user_id: UUID,
+        custom_name: Optional[str] = None
+    ) -> UploadResponse:
+        """
+        Record a file that a client uploaded directly to S3.
+        
+        Args:
+            upload_id: Upload ID issued by create_presigned_upload
+            filename: Original filename
+            file_type: Type of file (video/transcript)
+            user_id: User ID for organization
+            custom_name: Optional custom name for the file
+            
+        Returns:
+            UploadResponse: Upload information
+            
+        Raises:
+            HTTPException: If the object is missing or belongs to another user
+        """
+        # Check S3 availability
+        self._check_s3_available()
+        
+        s3_key = self.s3_service._generate_s3_key(
+            filename, file_type, upload_id, is_temp=True, user_id=user_id, custom_name=custom_name
+        )
+        
+        metadata = await self.s3_service.get_file_metadata(s3_key)
+        if not metadata:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Uploaded file not found in S3"
+            )
+        
+        object_metadata = metadata.get('metadata', {})
+        if (
+            object_metadata.get('upload-id') != str(upload_id)
+            or object_metadata.get('user-id') != str(user_id)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Uploaded file does not belong to this upload"
+            )
+        
+        try:
+            upload = await self._insert_upload(
+                id=upload_id,
+                filename=s3_key.split('/')[-1],
+                original_filename=filename,
+                file_type=file_type,
+                file_size_bytes=metadata['content_length'],
+                s3_bucket=self.s3_service.bucket_name,
+                s3_key=s3_key,
+                s3_url=f"s3://{self.s3_service.bucket_name}/{s3_key}",
+                is_temp=True
+            )
+        except Exception as e:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to save upload: {str(e)}"
+            )
+        
+        if upload is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Upload already completed"
+            )
+        
+        return UploadResponse(
+            id=upload.id,
+            filename=upload.filename,
+            original_filename=upload.original_filename,
+            file_type=upload.file_type,
+            file_size_mb=upload.file_size_mb,
+            upload_time=upload.upload_time
+        )
+    
     async def save_transcript_text(
         self,
         content: str,
@@ -194,7 +370,7 @@ class FileService:
             )
             
             # Create database record
-            upload = Upload(
+            upload = await self._insert_upload(
                 id=upload_id,
                 filename=s3_result['s3_key'].split('/')[-1],
                 original_filename=filename,
@@ -206,10 +382,8 @@ class FileService:
                 is_temp=is_temp,
                 job_id=job_id
             )
-            
-            self.db.add(upload)
-            await self.db.commit()
-            await self.db.refresh(upload)
+            if upload is None:
+                raise ValueError(f"Upload {upload_id} already exists")
             
             return UploadResponse(
                 id=upload.id,
@@ -237,6 +411,96 @@ class FileService:
                 detail=f"Failed to save transcript: {str(e)}"
             )
     
+    async def save_transcript_texts(
+        self,
+        contents: List[str],
+        user_id: Optional[UUID] = None,
+        is_temp: bool = True
+    ) -> List[UploadResponse]:
+        """
+        Save several transcripts to S3 and the database in one pass.
+        
+        S3 uploads run concurrently (bounded by BATCH_UPLOAD_CONCURRENCY)
+        and all upload records are written with a single INSERT.
+        
+        Args:
+            contents: Transcript text contents
+            user_id: User ID for organization
+            is_temp: Whether these are temporary files
+            
+        Returns:
+            List of UploadResponse, in the same order as contents
+            
+        Raises:
+            HTTPException: If any upload fails (successful S3 uploads are removed)
+        """
+        # Check S3 availability
+        self._check_s3_available()
+        
+        semaphore = asyncio.Semaphore(BATCH_UPLOAD_CONCURRENCY)
+        
+        async def _upload(content: str) -> Dict[str, Any]:
+            upload_id = uuid4()
+            async with semaphore:
+                s3_result = await self.s3_service.upload_transcript_text(
+                    content=content,
+                    upload_id=upload_id,
+                    is_temp=is_temp,
+                    user_id=user_id
+                )
+            return {
+                "id": upload_id,
+                "filename": s3_result['s3_key'].split('/')[-1],
+                "original_filename": "transcript.txt",
+                "file_type": "transcript",
+                "file_size_bytes": s3_result['file_size_bytes'],
+                "s3_bucket": s3_result['bucket_name'],
+                "s3_key": s3_result['s3_key'],
+                "s3_url": s3_result['s3_url'],
+                "is_temp": is_temp
+            }
+        
+        results = await asyncio.gather(
+            *(_upload(content) for content in contents),
+            return_exceptions=True
+        )
+        rows = [result for result in results if not isinstance(result, BaseException)]
+        
+        try:
+            if len(rows) != len(results):
+                failure = next(result for result in results if isinstance(result, BaseException))
+                raise failure
+            
+            result = await self.db.execute(
+                insert(Upload).returning(Upload, sort_by_parameter_order=True),
+                rows
+            )
+            uploads = result.scalars().all()
+            await self.db.commit()
+            
+        except Exception as e:
+            await self.db.rollback()
+            await self.s3_service.delete_multiple_files([row["s3_key"] for row in rows])
+            
+            if isinstance(e, HTTPException):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to save transcripts: {str(e)}"
+            )
+        
+        return [
+            UploadResponse(
+                id=upload.id,
+                filename=upload.filename,
+                original_filename=upload.original_filename,
+                file_type=upload.file_type,
+                file_size_mb=upload.file_size_mb,
+                upload_time=upload.upload_time
+            )
+            for upload in uploads
+        ]
+    
     async def get_upload_by_id(self, upload_id: UUID) -> Optional[Upload]:
         """
         Get upload by ID.
@@ -252,6 +516,35 @@ class FileService:
         )
         return result.scalar_one_or_none()
     
+    async def get_upload_response(self, upload_id: UUID) -> Optional[UploadResponse]:
+        """
+        Get upload information by ID, served from cache when possible.
+        
+        Args:
+            upload_id: Upload UUID
+            
+        Returns:
+            UploadResponse or None if not found
+        """
+        cached = _upload_response_cache.get(upload_id)
+        if cached is not None:
+            return cached
+        
+        upload = await self.get_upload_by_id(upload_id)
+        if not upload:
+            return None
+        
+        response = UploadResponse(
+            id=upload.id,
+            filename=upload.filename,
+            original_filename=upload.original_filename,
+            file_type=upload.file_type,
+            file_size_mb=upload.file_size_mb,
+            upload_time=upload.upload_time
+        )
+        _upload_response_cache[upload_id] = response
+        return response
+    
     async def get_file_content(self, upload_id: UUID) -> bytes:
         """
         Get file content from S3.
@@ -283,13 +576,40 @@ class FileService:
         
         return await self.s3_service.download_file(upload.s3_key)
     
-    async def get_presigned_download_url(self, upload_id: UUID, expiration: int = 3600) -> str:
+    async def get_file_stream(self, upload: Upload) -> StreamingBody:
+        """
+        Open a streaming handle to an upload's file in S3.
+        
+        Args:
+            upload: Upload record
+            
+        Returns:
+            botocore StreamingBody for the S3 object
+            
+        Raises:
+            HTTPException: If file is not in S3 or cannot be opened
+        """
+        # Check S3 availability
+        self._check_s3_available()
+        
+        if not upload.is_s3_stored:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File is not stored in S3"
+            )
+        
+        return await self.s3_service.get_file_stream(upload.s3_key)
+    
+    async def get_presigned_download_url(self, upload_id: UUID, expiration: Optional[int] = None) -> str:
         """
         Generate a presigned URL for downloading a file.
         
+        URLs with the default expiration are cached per upload, so repeat
+        requests skip both the database lookup and the signing step.
+        
         Args:
             upload_id: Upload UUID
-            expiration: URL expiration time in seconds
+            expiration: URL expiration time in seconds (defaults to settings)
             
         Returns:
             Presigned download URL
@@ -300,6 +620,12 @@ class FileService:
         # Check S3 availability
         self._check_s3_available()
         
+        use_cache = expiration is None or expiration == settings.s3_presigned_url_expiry
+        if use_cache:
+            cached_url = _presigned_url_cache.get(upload_id)
+            if cached_url:
+                return cached_url
+        
         upload = await self.get_upload_by_id(upload_id)
         if not upload:
             raise HTTPException(
@@ -313,10 +639,15 @@ class FileService:
                 detail="File is not stored in S3"
             )
         
-        return await self.s3_service.generate_presigned_url(
+        url = await self.s3_service.generate_presigned_url(
             upload.s3_key,
             expiration=expiration
         )
+        
+        if use_cache:
+            _presigned_url_cache[upload_id] = url
+        
+        return url
     
     async def delete_upload(self, upload_id: UUID) -> bool:
         """
@@ -328,18 +659,25 @@ class FileService:
         Returns:
             bool: True if deleted successfully
         """
-        upload = await self.get_upload_by_id(upload_id)
-        if not upload:
-            return False
-        
         try:
-            # Delete file from S3 if it exists and S3 is available
-            if upload.is_s3_stored and self.s3_service:
-                await self.s3_service.delete_file(upload.s3_key)
+            # Soft delete and fetch the S3 location in a single statement
+            result = await self.db.execute(
+                update(Upload)
+                .where(Upload.id == upload_id, Upload.is_active == True)
+                .values(is_active=False)
+                .returning(Upload.s3_key, Upload.s3_bucket)
+            )
+            row = result.first()
+            if not row:
+                return False
             
-            # Mark as inactive in database (soft delete)
-            upload.is_active = False
             await self.db.commit()
+            _presigned_url_cache.pop(upload_id, None)
+            _upload_response_cache.pop(upload_id, None)
+            
+            # Delete file from S3 if it exists and S3 is available
+            if row.s3_key and row.s3_bucket and self.s3_service:
+                await self.s3_service.delete_file(row.s3_key)
             
             return True
             
@@ -384,6 +722,8 @@ class FileService:
                 upload.filename = new_s3_key.split('/')[-1]
                 
                 await self.db.commit()
+                _presigned_url_cache.pop(upload_id, None)
+                _upload_response_cache.pop(upload_id, None)
                 return True
             
             return False
@@ -416,24 +756,15 @@ class FileService:
             hours = hours or settings.s3_cleanup_temp_hours
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
-            # Get old temp uploads
+            # Delete old temp upload records in a single statement
             result = await self.db.execute(
-                select(Upload).where(
+                delete(Upload).where(
                     Upload.is_temp == True,
                     Upload.is_active == False,
                     Upload.upload_time < cutoff_time
                 )
             )
-            old_uploads = result.scalars().all()
-            
-            # Delete old upload records
-            db_deleted_count = 0
-            for upload in old_uploads:
-                try:
-                    await self.db.delete(upload)
-                    db_deleted_count += 1
-                except Exception:
-                    continue
+            db_deleted_count = result.rowcount or 0
             
             await self.db.commit()
             
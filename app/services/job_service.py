@@ -266,6 +266,40 @@ class JobService:
         await self.db.commit()
         return True
     
+    async def finalize_youtube_upload(
+        self,
+        job_id: UUID,
+        youtube_url: str,
+        youtube_video_id: str,
+        message: str
+    ) -> bool:
+        """
+        Record a finished YouTube upload on a job with a single UPDATE.
+        
+        Args:
+            job_id: Job UUID
+            youtube_url: URL of the uploaded video
+            youtube_video_id: YouTube video ID
+            message: Progress message
+            
+        Returns:
+            bool: True if the job was found and updated
+        """
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(
+                progress=100,
+                progress_message=message,
+                status="completed",
+                youtube_url=youtube_url,
+                youtube_video_id=youtube_video_id,
+                updated_at=datetime.now(timezone.utc)
+            )
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+    
     async def update_job_completion(
         self, 
         job_id: UUID, 
@@ -295,6 +329,8 @@ class JobService:
         job.youtube_url = result_data.get("youtube_url")
         job.youtube_video_id = result_data.get("youtube_video_id")
         job.final_video_path = result_data.get("final_video_path")
+        if result_data.get("final_video_size_bytes") is not None:
+            job.file_size_mb = round(result_data["final_video_size_bytes"] / (1024 * 1024), 2)
         job.completed_at = datetime.now(timezone.utc)
         job.updated_at = datetime.now(timezone.utc)
         
@@ -427,8 +463,8 @@ class JobService:
         
         # Set up S3 folder structure for the new job
         try:
-            from app.services.s3_service import S3Service
-            s3_service = S3Service()
+            from app.services.s3_service import get_s3_service
+            s3_service = get_s3_service()
             
             await s3_service.create_job_folder_structure(
                 user_id=user_id,
@@ -467,8 +503,8 @@ class JobService:
             Dict with move results
         """
         try:
-            from app.services.s3_service import S3Service
-            s3_service = S3Service()
+            from app.services.s3_service import get_s3_service
+            s3_service = get_s3_service()
             
             results = {
                 'job_id': str(job_id),
@@ -573,8 +609,8 @@ class JobService:
             Dict with jobs and their files
         """
         try:
-            from app.services.s3_service import S3Service
-            s3_service = S3Service()
+            from app.services.s3_service import get_s3_service
+            s3_service = get_s3_service()
             
             # Get paginated jobs list
             jobs_result = await self.list_jobs(page=page, page_size=page_size)
@@ -4,19 +4,38 @@ S3 service for handling file storage operations with AWS S3
 
 import asyncio
 import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, List, BinaryIO
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, List, BinaryIO, AsyncIterator
 from uuid import UUID, uuid4
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, BotoCoreError
 from botocore.config import Config
+from botocore.response import StreamingBody
 from fastapi import UploadFile, HTTPException, status
 
 from app.config import get_settings
 
 settings = get_settings()
 
+# Maximum number of keys S3 accepts in a single DeleteObjects request
+S3_DELETE_BATCH_SIZE = 1000
+
+# Dedicated pool for blocking boto3 calls so concurrent uploads are not capped
+# by (or starve) the default asyncio executor. Sized to match the connection pool.
+_s3_executor = ThreadPoolExecutor(
+    max_workers=settings.s3_max_pool_connections,
+    thread_name_prefix="s3"
+)
+
+
+def shutdown_s3_executor() -> None:
+    """Shut down the shared S3 thread pool (called on application shutdown)."""
+    _s3_executor.shutdown(wait=False, cancel_futures=True)
+
 
 class S3Service:
     """Service for S3 file storage operations."""
@@ -30,7 +49,15 @@ class S3Service:
         config = Config(
             region_name=settings.aws_region,
             retries={'max_attempts': 3, 'mode': 'adaptive'},
-            max_pool_connections=50
+            max_pool_connections=settings.s3_max_pool_connections,
+            tcp_keepalive=True,
+            s3={
+                'use_accelerate_endpoint': settings.s3_accelerate,
+                'addressing_style': 'virtual',
+                # Send UNSIGNED-PAYLOAD over HTTPS so multipart parts are not
+                # SHA256-hashed before signing; TLS already protects the body.
+                'payload_signing_enabled': False
+            }
         )
         
         self.s3_client = boto3.client(
@@ -42,6 +69,21 @@ class S3Service:
         
         self.bucket_name = settings.s3_bucket_name
     
+    async def _run_in_executor(self, func, *args, **kwargs):
+        """
+        Run a blocking boto3 call on the shared S3 thread pool.
+        
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+            
+        Returns:
+            Result of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_s3_executor, partial(func, *args, **kwargs))
+    
     async def upload_file(
         self,
         file: UploadFile,
@@ -50,11 +92,16 @@ class S3Service:
         is_temp: bool = True,
         user_id: Optional[UUID] = None,
         job_id: Optional[UUID] = None,
-        custom_name: Optional[str] = None
+        custom_name: Optional[str] = None,
+        chunk_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Upload a file to S3.
         
+        The file body is streamed from the spooled upload file through the
+        boto3 transfer manager, which switches to a parallel multipart upload
+        above the configured threshold instead of buffering the whole body.
+        
         Args:
             file: FastAPI UploadFile object
             file_type: Type of file (video/transcript)
@@ -63,6 +110,7 @@ class S3Service:
             user_id: User ID for organization (required for non-temp files)
             job_id: Job ID for organization (optional for temp, required for permanent)
             custom_name: Custom name for the file (optional)
+            chunk_size: Multipart part size in bytes (optional)
             
         Returns:
             Dict with S3 upload information
@@ -91,23 +139,31 @@ class S3Service:
             if custom_name:
                 metadata['custom-name'] = custom_name
             
-            # Reset file pointer to beginning
-            await file.seek(0)
-            file_content = await file.read()
-            await file.seek(0)  # Reset for potential future reads
+            # Get file size without reading the body into memory
+            file.file.seek(0, 2)
+            file_size = file.file.tell()
+            file.file.seek(0)
             
-            # Upload to S3
-            await asyncio.to_thread(
-                self.s3_client.put_object,
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_content,
-                Metadata=metadata,
-                ContentType=file.content_type or 'application/octet-stream'
+            transfer_config = TransferConfig(
+                multipart_threshold=settings.s3_multipart_threshold,
+                multipart_chunksize=chunk_size or settings.s3_multipart_chunksize,
+                max_concurrency=settings.s3_max_concurrency,
+                use_threads=True
             )
             
-            # Get file size
-            file_size = len(file_content)
+            # Stream to S3 (multipart for large files)
+            await self._run_in_executor(
+                self.s3_client.upload_fileobj,
+                file.file,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={
+                    'Metadata': metadata,
+                    'ContentType': file.content_type or 'application/octet-stream'
+                },
+                Config=transfer_config
+            )
+            file.file.seek(0)  # Reset for potential future reads
             
             return {
                 's3_key': s3_key,
@@ -182,7 +238,7 @@ class S3Service:
             content_bytes = content.encode('utf-8')
             
             # Upload to S3
-            await asyncio.to_thread(
+            await self._run_in_executor(
                 self.s3_client.put_object,
                 Bucket=self.bucket_name,
                 Key=s3_key,
@@ -227,7 +283,7 @@ class S3Service:
             HTTPException: If download fails
         """
         try:
-            response = await asyncio.to_thread(
+            response = await self._run_in_executor(
                 self.s3_client.get_object,
                 Bucket=self.bucket_name,
                 Key=s3_key
@@ -250,6 +306,66 @@ class S3Service:
                 detail=f"File download failed: {str(e)}"
             )
     
+    async def get_file_stream(self, s3_key: str) -> StreamingBody:
+        """
+        Open a streaming handle to a file in S3 without reading it.
+        
+        Args:
+            s3_key: S3 object key
+            
+        Returns:
+            botocore StreamingBody for the object
+            
+        Raises:
+            HTTPException: If the object cannot be opened
+        """
+        try:
+            response = await self._run_in_executor(
+                self.s3_client.get_object,
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+            return response['Body']
+            
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="File not found in S3"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"S3 download failed: {str(e)}"
+            )
+    
+    async def iter_file_chunks(
+        self,
+        body: StreamingBody,
+        chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield an S3 object body in chunks without blocking the event loop.
+        
+        Each blocking read runs on the shared S3 thread pool, and the
+        underlying connection is released once the body is exhausted or
+        the client disconnects.
+        
+        Args:
+            body: botocore StreamingBody from get_object
+            chunk_size: Bytes per chunk
+            
+        Yields:
+            Chunks of the object body
+        """
+        try:
+            while True:
+                chunk = await self._run_in_executor(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+    
     async def delete_file(self, s3_key: str) -> bool:
         """
         Delete a file from S3.
@@ -261,7 +377,7 @@ class S3Service:
             True if deleted successfully
         """
         try:
-            await asyncio.to_thread(
+            await self._run_in_executor(
                 self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=s3_key
@@ -277,6 +393,9 @@ class S3Service:
         """
         Delete multiple files from S3.
         
+        Keys are sent in DeleteObjects batches of up to 1000 (the S3 limit)
+        in quiet mode, so only failures are reported back.
+        
         Args:
             s3_keys: List of S3 object keys
             
@@ -286,25 +405,49 @@ class S3Service:
         if not s3_keys:
             return {"success": 0, "failed": 0}
         
-        try:
-            # Prepare delete objects request
-            delete_objects = [{'Key': key} for key in s3_keys]
-            
-            response = await asyncio.to_thread(
-                self.s3_client.delete_objects,
-                Bucket=self.bucket_name,
-                Delete={'Objects': delete_objects}
-            )
-            
-            deleted = len(response.get('Deleted', []))
-            errors = len(response.get('Errors', []))
+        deleted = 0
+        failed = 0
+        
+        for i in range(0, len(s3_keys), S3_DELETE_BATCH_SIZE):
+            batch = s3_keys[i:i + S3_DELETE_BATCH_SIZE]
             
-            return {"success": deleted, "failed": errors}
+            try:
+                response = await self._run_in_executor(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in batch],
+                        'Quiet': True
+                    }
+                )
+                
+                errors = len(response.get('Errors', []))
+                deleted += len(batch) - errors
+                failed += errors
+                
+            except Exception:
+                failed += len(batch)
+        
+        return {"success": deleted, "failed": failed}
+    
+    async def _list_all_objects(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        List every object under a prefix, following continuation tokens.
+        
+        Args:
+            prefix: S3 prefix to list
             
-        except (ClientError, BotoCoreError):
-            return {"success": 0, "failed": len(s3_keys)}
-        except Exception:
-            return {"success": 0, "failed": len(s3_keys)}
+        Returns:
+            List of raw S3 object entries
+        """
+        def _list() -> List[Dict[str, Any]]:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            contents = []
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                contents.extend(page.get('Contents', []))
+            return contents
+        
+        return await self._run_in_executor(_list)
     
     async def generate_presigned_url(
         self,
@@ -329,8 +472,9 @@ class S3Service:
         try:
             expiration = expiration or settings.s3_presigned_url_expiry
             
-            url = await asyncio.to_thread(
-                self.s3_client.generate_presigned_url,
+            # Presigning is local SigV4 computation with static credentials,
+            # so it runs inline rather than paying a thread-pool hop.
+            url = self.s3_client.generate_presigned_url(
                 method,
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expiration
@@ -344,6 +488,57 @@ class S3Service:
                 detail=f"Failed to generate presigned URL: {str(e)}"
             )
     
+    async def generate_presigned_post(
+        self,
+        s3_key: str,
+        content_type: str,
+        max_size_bytes: int,
+        metadata: Optional[Dict[str, str]] = None,
+        expiration: int = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a presigned POST so a client can upload directly to S3.
+        
+        Args:
+            s3_key: S3 object key the client must upload to
+            content_type: Content type the client must send
+            max_size_bytes: Maximum accepted object size
+            metadata: Object metadata the client must send
+            expiration: URL expiration time in seconds
+            
+        Returns:
+            Dict with the POST url and form fields
+            
+        Raises:
+            HTTPException: If generation fails
+        """
+        try:
+            expiration = expiration or settings.s3_presigned_url_expiry
+            
+            fields = {'Content-Type': content_type}
+            conditions = [
+                {'Content-Type': content_type},
+                ['content-length-range', 1, max_size_bytes]
+            ]
+            for key, value in (metadata or {}).items():
+                fields[f'x-amz-meta-{key}'] = value
+                conditions.append({f'x-amz-meta-{key}': value})
+            
+            # Local signing only, no network I/O
+            return self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expiration
+            )
+            
+        except (ClientError, BotoCoreError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate presigned upload: {str(e)}"
+            )
+    
     async def move_file(self, source_key: str, destination_key: str) -> bool:
         """
         Move a file from temp to permanent location in S3.
@@ -357,7 +552,7 @@ class S3Service:
         """
         try:
             # Copy object to new location
-            await asyncio.to_thread(
+            await self._run_in_executor(
                 self.s3_client.copy_object,
                 Bucket=self.bucket_name,
                 CopySource={'Bucket': self.bucket_name, 'Key': source_key},
@@ -389,30 +584,18 @@ class S3Service:
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
             # List objects in temp prefix
-            response = await asyncio.to_thread(
-                self.s3_client.list_objects_v2,
-                Bucket=self.bucket_name,
-                Prefix=settings.s3_temp_prefix
-            )
+            contents = await self._list_all_objects(settings.s3_temp_prefix)
             
-            old_objects = []
-            for obj in response.get('Contents', []):
-                if obj['LastModified'].replace(tzinfo=timezone.utc) < cutoff_time:
-                    old_objects.append(obj['Key'])
-            
-            if old_objects:
-                result = await self.delete_multiple_files(old_objects)
-                return {
-                    "total_checked": len(response.get('Contents', [])),
-                    "deleted": result["success"],
-                    "failed": result["failed"],
-                    "cutoff_time": cutoff_time.isoformat()
-                }
+            old_objects = [
+                obj['Key'] for obj in contents
+                if obj['LastModified'].replace(tzinfo=timezone.utc) < cutoff_time
+            ]
             
+            result = await self.delete_multiple_files(old_objects)
             return {
-                "total_checked": len(response.get('Contents', [])),
-                "deleted": 0,
-                "failed": 0,
+                "total_checked": len(contents),
+                "deleted": result["success"],
+                "failed": result["failed"],
                 "cutoff_time": cutoff_time.isoformat()
             }
             
@@ -434,7 +617,7 @@ class S3Service:
             Dict with file metadata or None if not found
         """
         try:
-            response = await asyncio.to_thread(
+            response = await self._run_in_executor(
                 self.s3_client.head_object,
                 Bucket=self.bucket_name,
                 Key=s3_key
@@ -525,7 +708,7 @@ class S3Service:
             List of file information dictionaries
         """
         try:
-            response = await asyncio.to_thread(
+            response = await self._run_in_executor(
                 self.s3_client.list_objects_v2,
                 Bucket=self.bucket_name,
                 Prefix=prefix
@@ -556,7 +739,7 @@ class S3Service:
             List of S3 object information dictionaries
         """
         try:
-            response = await asyncio.to_thread(
+            response = await self._run_in_executor(
                 self.s3_client.list_objects_v2,
                 Bucket=self.bucket_name
             )
@@ -578,6 +761,44 @@ class S3Service:
                 detail=f"Failed to list objects: {str(e)}"
             )
 
+    async def iter_object_pages(self, prefix: str = "") -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield objects under a prefix one list_objects_v2 page at a time.
+        
+        Pages (up to 1000 keys each) are fetched on the shared S3 thread
+        pool only as the caller consumes them, so memory stays bounded by
+        a single page regardless of bucket size.
+        
+        Args:
+            prefix: S3 prefix to list
+            
+        Yields:
+            List of S3 object information dictionaries for one page
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = iter(paginator.paginate(Bucket=self.bucket_name, Prefix=prefix))
+        
+        while True:
+            try:
+                page = await self._run_in_executor(next, pages, None)
+            except (ClientError, BotoCoreError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to list objects: {str(e)}"
+                )
+            if page is None:
+                return
+            
+            yield [
+                {
+                    'Key': obj['Key'],
+                    'Size': obj['Size'],
+                    'LastModified': obj['LastModified'],
+                    'ETag': obj.get('ETag', '').strip('"')
+                }
+                for obj in page.get('Contents', [])
+            ]
+
     def get_object_metadata(self, s3_key: str) -> Dict[str, Any]:
         """
         Get object metadata synchronously (for use in sync operations).
@@ -719,7 +940,7 @@ class S3Service:
                 # Create a placeholder file to establish the folder structure
                 placeholder_key = f"{user_id}/{job_id}/{folder}/.placeholder"
                 
-                await asyncio.to_thread(
+                await self._run_in_executor(
                     self.s3_client.put_object,
                     Bucket=self.bucket_name,
                     Key=placeholder_key,
@@ -773,7 +994,7 @@ class S3Service:
                 prefix = f"{user_id}/"
             
             # List objects with the user prefix
-            response = await asyncio.to_thread(
+            response = await self._run_in_executor(
                 self.s3_client.list_objects_v2,
                 Bucket=self.bucket_name,
                 Prefix=prefix,
@@ -841,40 +1062,20 @@ class S3Service:
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
             # List temp files for this user
-            response = await asyncio.to_thread(
-                self.s3_client.list_objects_v2,
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+            contents = await self._list_all_objects(prefix)
             
-            files_to_delete = []
-            for obj in response.get('Contents', []):
-                if obj['LastModified'].replace(tzinfo=timezone.utc) < cutoff_time:
-                    files_to_delete.append({'Key': obj['Key']})
+            files_to_delete = [
+                obj['Key'] for obj in contents
+                if obj['LastModified'].replace(tzinfo=timezone.utc) < cutoff_time
+            ]
             
             if not files_to_delete:
                 return {'deleted': 0, 'failed': 0, 'message': 'No temp files to delete'}
             
             # Delete files in batches
-            deleted = 0
-            failed = 0
-            
-            for i in range(0, len(files_to_delete), 1000):  # S3 limit is 1000 per batch
-                batch = files_to_delete[i:i+1000]
-                
-                try:
-                    response = await asyncio.to_thread(
-                        self.s3_client.delete_objects,
-                        Bucket=self.bucket_name,
-                        Delete={'Objects': batch}
-                    )
-                    
-                    deleted += len(response.get('Deleted', []))
-                    failed += len(response.get('Errors', []))
-                    
-                except Exception as batch_error:
-                    failed += len(batch)
-                    print(f"Batch delete error: {batch_error}")
+            result = await self.delete_multiple_files(files_to_delete)
+            deleted = result["success"]
+            failed = result["failed"]
             
             return {
                 'deleted': deleted,
@@ -887,4 +1088,22 @@ class S3Service:
                 'deleted': 0,
                 'failed': 0,
                 'error': f"Cleanup failed for user {user_id}: {str(e)}"
-            } 
\ No newline at end of file
+            }
+
+
+@lru_cache(maxsize=1)
+def get_s3_service() -> S3Service:
+    """
+    Get the shared S3 service instance.
+    
+    The boto3 client is thread-safe, so one instance (and its connection
+    pool) is reused across requests. Construction errors are not cached,
+    so a missing configuration is re-checked on the next call.
+    
+    Returns:
+        S3Service instance
+        
+    Raises:
+        ValueError: If AWS credentials or bucket are not configured
+    """
+    return S3Service()
@@ -94,9 +94,6 @@ class VideoService:
             
             # Initialize S3 client
             import boto3
-            from app.config import get_settings
-            
-            settings = get_settings()
             
             s3_client = boto3.client(
                 's3',
@@ -167,9 +164,6 @@ class VideoService:
             
             # Initialize S3 client
             import boto3
-            from app.config import get_settings
-            
-            settings = get_settings()
             
             s3_client = boto3.client(
                 's3',
@@ -542,6 +536,19 @@ class VideoService:
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
+    async def check_dependencies(self) -> Tuple[bool, bool]:
+        """
+        Probe for FFmpeg and ffprobe concurrently, off the event loop.
+        
+        Returns:
+            Tuple of (ffmpeg_available, ffprobe_available)
+        """
+        ffmpeg_available, ffprobe_available = await asyncio.gather(
+            asyncio.to_thread(self._check_ffmpeg_available),
+            asyncio.to_thread(self._check_ffprobe_available)
+        )
+        return ffmpeg_available, ffprobe_available
+    
     async def test_audio_file(self, audio_path: str) -> Dict[str, Any]:
         """
         Test if an audio file is valid and playable.
@@ -838,8 +845,7 @@ class VideoService:
         Returns:
             Dict with video capabilities information
         """
-        ffmpeg_available = self._check_ffmpeg_available()
-        ffprobe_available = self._check_ffprobe_available()
+        ffmpeg_available, ffprobe_available = await self.check_dependencies()
         
         return {
             "service": "Video Processing Service",
@@ -3,6 +3,9 @@ YouTube service for integrating with specialized processing services
 """
 
 import asyncio
+import os
+import shutil
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Any
 from uuid import UUID
 
@@ -14,6 +17,26 @@ from app.services.youtube_upload_service import YouTubeUploadService
 settings = get_settings()
 
 
+def _free_disk_bytes(directory: str) -> Optional[int]:
+    """
+    Get free space in a directory, creating it if needed.
+    
+    Args:
+        directory: Directory path
+        
+    Returns:
+        Free bytes, or None if the directory is missing and cannot be created
+        or is not writable
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(directory, os.W_OK):
+        return None
+    return shutil.disk_usage(directory).free
+
+
 class YouTubeService:
     """Service for YouTube integration with specialized processing services."""
     
@@ -135,6 +158,7 @@ class YouTubeService:
                     "status": "success",
                     "mode": "mock",
                     "final_video_path": final_video_path,
+                    "final_video_size_bytes": video_result.get("file_size_bytes"),
                     "title": title,
                     "description": description,
                     "tags": tags or [],
@@ -264,6 +288,15 @@ class YouTubeService:
         """
         return self.supported_voices
     
+    def get_voice_info(self) -> Dict[str, Any]:
+        """
+        Get information about available TTS voices.
+        
+        Returns:
+            Dict with voice descriptions, models and limits
+        """
+        return self.tts_service.get_voice_info()
+    
     async def get_processing_capabilities(self) -> Dict[str, Any]:
         """
         Get detailed processing capabilities and system requirements.
@@ -271,8 +304,10 @@ class YouTubeService:
         Returns:
             Dict with capabilities information
         """
-        tts_capabilities = await self.tts_service.get_capabilities()
-        video_capabilities = await self.video_service.get_capabilities()
+        tts_capabilities, video_capabilities = await asyncio.gather(
+            self.tts_service.get_capabilities(),
+            self.video_service.get_capabilities()
+        )
         youtube_guidelines = self.youtube_upload_service.get_upload_guidelines()
         
         return {
@@ -321,6 +356,44 @@ class YouTubeService:
             }
         }
     
+    async def validate_processing_requirements(self) -> Dict[str, Any]:
+        """
+        Check that the tools and configuration needed for processing are present.
+        
+        The independent probes (FFmpeg, ffprobe, temp directory) run concurrently.
+        
+        Returns:
+            Dict with overall status, individual checks and a list of issues
+        """
+        (ffmpeg_available, ffprobe_available), temp_free_bytes = await asyncio.gather(
+            self.video_service.check_dependencies(),
+            asyncio.to_thread(_free_disk_bytes, settings.temp_directory)
+        )
+        
+        checks = {
+            "ffmpeg_available": ffmpeg_available,
+            "ffprobe_available": ffprobe_available,
+            "openai_configured": settings.openai_configured,
+            "temp_directory_writable": temp_free_bytes is not None,
+            "temp_directory_free_mb": temp_free_bytes // (1024 * 1024) if temp_free_bytes is not None else None
+        }
+        
+        issues = []
+        if not ffmpeg_available:
+            issues.append("FFmpeg is not installed or not on PATH")
+        if not ffprobe_available:
+            issues.append("ffprobe is not installed or not on PATH")
+        if not settings.openai_configured:
+            issues.append("OPENAI_API_KEY is not set; TTS will run in mock mode")
+        if temp_free_bytes is None:
+            issues.append(f"Temp directory {settings.temp_directory} is not writable")
+        
+        return {
+            "requirements_met": ffmpeg_available and ffprobe_available and temp_free_bytes is not None,
+            "checks": checks,
+            "issues": issues
+        }
+    
     async def get_setup_instructions(self) -> Dict[str, Any]:
         """
         Get setup instructions for all required services.
@@ -510,4 +583,18 @@ class YouTubeService:
                 "channel_id": None,
                 "channel_title": None,
                 "authenticated_at": None
-            } 
\ No newline at end of file
+            }
+
+
+@lru_cache(maxsize=1)
+def get_youtube_service() -> YouTubeService:
+    """
+    Get the shared user-independent YouTube service instance.
+    
+    Only for endpoints that need no user credentials (voices, capabilities,
+    previews); per-user OAuth flows still construct their own instance.
+    
+    Returns:
+        YouTubeService instance
+    """
+    return YouTubeService()
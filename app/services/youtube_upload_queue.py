@@ -0,0 +1,241 @@
+"""
+Background queue for YouTube uploads
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+import aiofiles.os
+from cachetools import TTLCache
+from fastapi import HTTPException, status
+
+from app.services.youtube_upload_service import YouTubeUploadService, get_youtube_upload_service
+
+logger = logging.getLogger(__name__)
+
+# Uploads waiting for a worker; enqueueing fails fast once this many are pending
+UPLOAD_QUEUE_MAXSIZE = 32
+
+# Uploads running concurrently
+UPLOAD_WORKER_COUNT = 8
+
+# Attempts per upload; the wait between attempts doubles (1s, 2s, ...)
+UPLOAD_MAX_ATTEMPTS = 3
+
+# How long finished upload statuses stay available for polling
+UPLOAD_STATUS_TTL_SECONDS = 24 * 3600
+
+_upload_status_cache: TTLCache = TTLCache(maxsize=10_000, ttl=UPLOAD_STATUS_TTL_SECONDS)
+_upload_queue: Optional[asyncio.Queue] = None
+_upload_workers: List[asyncio.Task] = []
+
+
+def start_upload_workers() -> None:
+    """Create the upload queue and start its worker tasks."""
+    global _upload_queue
+    
+    if _upload_queue is not None:
+        return
+    
+    _upload_queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_MAXSIZE)
+    for _ in range(UPLOAD_WORKER_COUNT):
+        _upload_workers.append(asyncio.create_task(_upload_worker(_upload_queue)))
+
+
+async def stop_upload_workers() -> None:
+    """Cancel the upload workers; queued uploads that have not started are dropped."""
+    global _upload_queue
+    
+    for worker in _upload_workers:
+        worker.cancel()
+    await asyncio.gather(*_upload_workers, return_exceptions=True)
+    _upload_workers.clear()
+    _upload_queue = None
+
+
+async def enqueue_upload(
+    user_id: UUID,
+    video_path: str,
+    upload_kwargs: Dict[str, Any],
+    cleanup_path: Optional[str] = None,
+    on_success: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """
+    Queue a video for upload to YouTube.
+    
+    Args:
+        user_id: User UUID owning the upload
+        video_path: Local path of the video file
+        upload_kwargs: Keyword arguments for upload_video_to_youtube
+            (title, description, tags, category, privacy)
+        cleanup_path: Temporary file to remove once the upload finishes
+        on_success: Coroutine called with the YouTube result after a successful upload
+    
+    Returns:
+        Initial upload status (including the upload_id)
+    
+    Raises:
+        HTTPException: If the queue is not running or is full
+    """
+    if _upload_queue is None:
+        await _remove_file(cleanup_path)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Upload queue is not running"
+        )
+    
+    upload_status = {
+        "upload_id": str(uuid4()),
+        "user_id": str(user_id),
+        "status": "queued",
+        "attempts": 0,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "completed_at": None,
+        "youtube_data": None,
+        "error_message": None
+    }
+    
+    _upload_status_cache[upload_status["upload_id"]] = upload_status
+    try:
+        _upload_queue.put_nowait({
+            "upload_id": upload_status["upload_id"],
+            "video_path": video_path,
+            "upload_kwargs": upload_kwargs,
+            "cleanup_path": cleanup_path,
+            "on_success": on_success
+        })
+    except asyncio.QueueFull:
+        _upload_status_cache.pop(upload_status["upload_id"], None)
+        await _remove_file(cleanup_path)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many uploads in progress, please try again later"
+        )
+    
+    return upload_status
+
+
+async def validate_upload(upload_kwargs: Dict[str, Any]) -> None:
+    """
+    Check upload metadata before any file work, so bad requests fail fast.
+    
+    Args:
+        upload_kwargs: Keyword arguments for upload_video_to_youtube
+        
+    Raises:
+        HTTPException: If the metadata would be rejected by the upload
+    """
+    validation_result = await get_youtube_upload_service()._validate_upload_params(**upload_kwargs)
+    if not validation_result["valid"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=validation_result["error"]
+        )
+
+
+def get_upload_status(upload_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the status of a queued upload.
+    
+    Args:
+        upload_id: Upload ID returned by enqueue_upload
+    
+    Returns:
+        Upload status dict or None if unknown or expired
+    """
+    return _upload_status_cache.get(upload_id)
+
+
+def _update_upload_status(upload_id: str, **fields: Any) -> None:
+    """Merge fields into an upload's status, re-storing it to refresh its TTL."""
+    upload_status = dict(_upload_status_cache.get(upload_id) or {"upload_id": upload_id})
+    upload_status.update(fields)
+    _upload_status_cache[upload_id] = upload_status
+
+
+async def _remove_file(path: Optional[str]) -> None:
+    """Remove a temporary file off the event loop, ignoring errors."""
+    if not path:
+        return
+    try:
+        await aiofiles.os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to clean up temp file {path}: {e}")
+
+
+async def _upload_worker(queue: asyncio.Queue) -> None:
+    """Process queued uploads until cancelled."""
+    upload_service = get_youtube_upload_service()
+    
+    while True:
+        item = await queue.get()
+        try:
+            await _process_upload(upload_service, item)
+        except Exception:
+            logger.exception(f"Upload {item['upload_id']} crashed")
+            _update_upload_status(
+                item["upload_id"],
+                status="failed",
+                completed_at=datetime.now(timezone.utc).isoformat(),
+                error_message="Internal error while uploading"
+            )
+        finally:
+            await _remove_file(item["cleanup_path"])
+            queue.task_done()
+
+
+async def _process_upload(upload_service: YouTubeUploadService, item: Dict[str, Any]) -> None:
+    """
+    Upload one queued video, retrying failed attempts with exponential backoff.
+    
+    Args:
+        upload_service: YouTube upload service
+        item: Queue item built by enqueue_upload
+    """
+    upload_id = item["upload_id"]
+    error_message = None
+    
+    for attempt in range(UPLOAD_MAX_ATTEMPTS):
+        _update_upload_status(upload_id, status="uploading", attempts=attempt + 1)
+        
+        try:
+            upload_result = await upload_service.upload_video_to_youtube(
+                video_path=item["video_path"],
+                **item["upload_kwargs"]
+            )
+        except Exception as e:
+            upload_result = {"status": "error", "error_message": str(e)}
+        
+        if upload_result["status"] != "error":
+            if item["on_success"] is not None:
+                # The video is already on YouTube, so a failing follow-up
+                # must not turn into a retry
+                try:
+                    await item["on_success"](upload_result)
+                except Exception:
+                    logger.exception(f"Post-upload step for upload {upload_id} failed")
+            
+            _update_upload_status(
+                upload_id,
+                status="completed",
+                completed_at=datetime.now(timezone.utc).isoformat(),
+                youtube_data=upload_result
+            )
+            return
+        
+        error_message = upload_result.get("error_message")
+        logger.warning(f"Upload {upload_id} attempt {attempt + 1} failed: {error_message}")
+        if attempt + 1 < UPLOAD_MAX_ATTEMPTS:
+            await asyncio.sleep(2 ** attempt)
+    
+    _update_upload_status(
+        upload_id,
+        status="failed",
+        completed_at=datetime.now(timezone.utc).isoformat(),
+        error_message=error_message
+    )
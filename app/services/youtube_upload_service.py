@@ -9,12 +9,18 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 import tempfile
 import logging
+from functools import lru_cache
 
 from app.config import get_settings
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Upper bound on YouTube uploads in flight across the process; past ~20
+# concurrent resumable uploads the API starts answering with 5xx errors
+YOUTUBE_UPLOAD_CONCURRENCY = 20
+_youtube_upload_semaphore = asyncio.Semaphore(YOUTUBE_UPLOAD_CONCURRENCY)
+
 
 class YouTubeUploadService:
     """Service for uploading videos to YouTube using YouTube Data API v3."""
@@ -178,9 +184,10 @@ class YouTubeUploadService:
                 raise Exception("User authentication not configured. YouTube upload requires authenticated user.")
             
             # Perform real YouTube upload
-            return await self._perform_youtube_upload(
-                video_path, title, description, tags, category, privacy, made_for_kids
-            )
+            async with _youtube_upload_semaphore:
+                return await self._perform_youtube_upload(
+                    video_path, title, description, tags, category, privacy, made_for_kids
+                )
             
         except Exception as e:
             # Improve error logging and avoid nested error messages
@@ -276,7 +283,8 @@ class YouTubeUploadService:
             
             while response is None:
                 try:
-                    status, response = insert_request.next_chunk()
+                    # The client is synchronous (httplib2); keep it off the event loop
+                    status, response = await asyncio.to_thread(insert_request.next_chunk)
                     if status:
                         logger.info(f"Upload progress: {int(status.progress() * 100)}%")
                 except HttpError as e:
@@ -739,4 +747,18 @@ class YouTubeUploadService:
                 "oauth2_setup": "https://developers.google.com/youtube/v3/guides/auth/installed-apps",
                 "upload_guide": "https://developers.google.com/youtube/v3/guides/uploading_a_video"
             }
-        } 
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=1)
+def get_youtube_upload_service() -> YouTubeUploadService:
+    """
+    Get the shared YouTube upload service instance.
+    
+    The service holds no per-request state after construction, so one
+    instance is reused for uploads that need no user credentials.
+    
+    Returns:
+        YouTubeUploadService instance
+    """
+    return YouTubeUploadService()
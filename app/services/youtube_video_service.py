@@ -7,11 +7,13 @@ import tempfile
 import os
 import json
 import time
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 from uuid import UUID, uuid4
 from pathlib import Path
 from datetime import datetime, timezone
 
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -19,11 +21,73 @@ from app.config import get_settings
 from app.models.video import Video
 from app.models.user import User
 from app.repositories.video_repository import VideoRepository
-from app.services.s3_service import S3Service
+from app.services.s3_service import get_s3_service
 from app.schemas.video import VideoCreate
 
 settings = get_settings()
 
+# How long sync progress stays available for status polls
+SYNC_STATUS_TTL_SECONDS = 24 * 3600
+
+# Process-local sync progress, used only when Redis is not configured
+_sync_status_cache: TTLCache = TTLCache(maxsize=1_000, ttl=SYNC_STATUS_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _get_redis():
+    """
+    Get the shared Redis client for sync progress, if Redis is configured.
+    
+    Returns:
+        redis.asyncio.Redis instance, or None to use the in-process cache
+    """
+    if not settings.redis_configured:
+        return None
+    
+    import redis.asyncio as aioredis
+    return aioredis.from_url(
+        settings.redis_url,
+        password=settings.redis_password,
+        decode_responses=True
+    )
+
+
+async def _save_sync_status(sync_status: Dict[str, Any]) -> None:
+    """
+    Store sync progress so any worker can answer status polls.
+    
+    Args:
+        sync_status: Sync status dict (must contain sync_id)
+    """
+    redis_client = _get_redis()
+    if redis_client is None:
+        _sync_status_cache[sync_status["sync_id"]] = sync_status
+        return
+    
+    await redis_client.set(
+        f"sync:{sync_status['sync_id']}",
+        json.dumps(sync_status),
+        ex=SYNC_STATUS_TTL_SECONDS
+    )
+
+
+async def _load_sync_status(sync_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load stored sync progress.
+    
+    Args:
+        sync_id: Sync operation ID
+        
+    Returns:
+        Sync status dict or None if unknown or expired
+    """
+    redis_client = _get_redis()
+    if redis_client is None:
+        return _sync_status_cache.get(sync_id)
+    
+    raw_status = await redis_client.get(f"sync:{sync_id}")
+    return json.loads(raw_status) if raw_status else None
+
 
 class YouTubeVideoService:
     """Service for downloading YouTube videos and uploading to S3."""
@@ -32,7 +96,7 @@ class YouTubeVideoService:
         """Initialize YouTube video service."""
         self.db = db
         self.video_repository = VideoRepository(db)
-        self.s3_service = S3Service()
+        self.s3_service = get_s3_service()
         self.temp_dir = Path(tempfile.gettempdir())
         self.supported_formats = ["mp4", "webm", "mkv"]
         
@@ -150,22 +214,51 @@ class YouTubeVideoService:
                 except Exception as cleanup_error:
                     print(f"Warning: Failed to clean up temp file {temp_video_path}: {cleanup_error}")
     
+    async def start_sync(self, user_id: UUID, sync_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Register a new pending sync operation.
+        
+        Args:
+            user_id: User UUID
+            sync_id: Sync operation ID (generated if omitted)
+            
+        Returns:
+            Initial sync status (including the sync_id)
+        """
+        sync_status = {
+            "sync_id": sync_id or str(uuid4()),
+            "user_id": str(user_id),
+            "status": "pending",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": None,
+            "progress": 0,
+            "message": "Sync operation queued"
+        }
+        await _save_sync_status(sync_status)
+        return sync_status
+    
     async def sync_all_videos_to_s3(
         self,
         user_id: UUID,
-        max_videos: int = 50
+        max_videos: int = 50,
+        sync_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Sync all user's YouTube videos to S3.
         
+        Progress is published after every video so it can be polled
+        through get_sync_status.
+        
         Args:
             user_id: User UUID
             max_videos: Maximum number of videos to sync
+            sync_id: ID from start_sync; a new one is registered if omitted
             
         Returns:
             Dict with sync operation summary
         """
-        sync_id = str(uuid4())
+        sync_status = await self._load_or_start_sync(user_id, sync_id)
+        sync_id = sync_status["sync_id"]
         start_time = time.time()
         
         results = {
@@ -178,12 +271,26 @@ class YouTubeVideoService:
             "processing_time_seconds": 0
         }
         
+        async def _publish(status: str, progress: int, message: str) -> None:
+            results["processing_time_seconds"] = round(time.time() - start_time, 2)
+            sync_status.update(
+                status=status,
+                progress=progress,
+                message=message,
+                results=results
+            )
+            if status in ("completed", "failed"):
+                sync_status["completed_at"] = datetime.now(timezone.utc).isoformat()
+            await _save_sync_status(sync_status)
+        
         try:
+            await _publish("running", 0, "Fetching YouTube videos")
+            
             # Get all YouTube videos
             youtube_videos = await self._fetch_youtube_videos(page_size=max_videos)
             results["total_videos_found"] = len(youtube_videos["videos"])
             
-            for video in youtube_videos["videos"]:
+            for index, video in enumerate(youtube_videos["videos"], start=1):
                 try:
                     # Check if already in S3
                     existing = await self._check_video_exists_in_s3(
@@ -209,14 +316,29 @@ class YouTubeVideoService:
                 except Exception as video_error:
                     results["errors"] += 1
                     print(f"Error syncing video {video.get('id', 'unknown')}: {video_error}")
+                
+                finally:
+                    await _publish(
+                        "running",
+                        int(index * 100 / results["total_videos_found"]),
+                        f"Processed {index} of {results['total_videos_found']} videos"
+                    )
             
-            results["processing_time_seconds"] = round(time.time() - start_time, 2)
+            await _publish("completed", 100, "Sync operation completed")
             return results
             
         except Exception as e:
-            results["processing_time_seconds"] = round(time.time() - start_time, 2)
+            await _publish("failed", sync_status["progress"], f"Sync operation failed: {str(e)}")
             raise Exception(f"Sync operation failed: {str(e)}")
     
+    async def _load_or_start_sync(self, user_id: UUID, sync_id: Optional[str]) -> Dict[str, Any]:
+        """Get the stored status for sync_id, registering a new sync if needed."""
+        if sync_id:
+            sync_status = await _load_sync_status(sync_id)
+            if sync_status:
+                return sync_status
+        return await self.start_sync(user_id, sync_id)
+    
     async def get_sync_status(self, sync_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the status of a sync operation.
@@ -227,16 +349,7 @@ class YouTubeVideoService:
         Returns:
             Sync status information or None if not found
         """
-        # In a real implementation, you would store sync status in a database
-        # For now, we'll return a placeholder response
-        return {
-            "sync_id": sync_id,
-            "status": "completed",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": datetime.now(timezone.utc).isoformat(),
-            "progress": 100,
-            "message": "Sync operation completed"
-        }
+        return await _load_sync_status(sync_id)
     
     # Private helper methods
     